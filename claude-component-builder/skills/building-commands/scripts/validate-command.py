@@ -5,14 +5,96 @@ Validates YAML frontmatter, naming conventions, and schema compliance.
 """
 
 import re
+import string
 import sys
 import yaml
 from pathlib import Path
 
+# Prefer the libyaml-backed loader when available - frontmatter is parsed once
+# per validated file and the C loader is an order of magnitude faster
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # Ensure UTF-8 output for Unicode characters on Windows
 if sys.stdout.encoding != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
+# Precompiled patterns - validate_command runs once per file during bulk audits,
+# so compiling at module load keeps the per-file hot path free of re-cache lookups
+POSITIONAL_ARG_RE = re.compile(r'\$\d+')
+BASH_BLOCK_RE = re.compile(r'```(?:bash|sh)\n(.*?)```', re.DOTALL)
+BASH_POSITIONAL_RE = re.compile(r'\$[1-9]')
+VALIDATION_HINT_RE = re.compile(r'(validate|check|if\s+\[|test\s+)', re.IGNORECASE)
+
+# Filename validation - checked with one pass over the name per file
+VALID_NAME_CHARS = frozenset(string.ascii_lowercase + string.digits + '-')
+COMMON_VERBS = (
+    'add', 'build', 'check', 'clean', 'commit', 'create', 'delete', 'deploy',
+    'generate', 'get', 'install', 'list', 'make', 'push', 'remove', 'review',
+    'run', 'search', 'show', 'test', 'update', 'validate'
+)
+
+# Dangerous patterns ONLY checked in bash code blocks - these are CRITICAL security issues
+_CRITICAL_SPECS = [
+    (r'eval\s+\$', "SECURITY ERROR: Using eval with arguments enables arbitrary code execution"),
+    (r'rm\s+-rf\s+/\s*$', "SECURITY ERROR: rm -rf / detected - this will delete entire filesystem"),
+    (r'\|\s*bash\b', "SECURITY ERROR: Piping to bash enables arbitrary code execution"),
+    (r'curl.*\|\s*sh', "SECURITY ERROR: Piping curl to sh enables remote code execution"),
+    (r'wget.*\|\s*sh', "SECURITY ERROR: Piping wget to sh enables remote code execution"),
+]
+
+# Warning-level patterns checked in bash code blocks
+_WARNING_SPECS = [
+    (r'rm\s+-rf\s+\$', "Dangerous rm -rf with variable - ensure input validation before use"),
+    (r'\$\w+\s*(?:&&|\||;)', "Potential command injection - ensure variables are validated/quoted"),
+]
+
+CRITICAL_PATTERNS = [(re.compile(pat, re.IGNORECASE), msg) for pat, msg in _CRITICAL_SPECS]
+WARNING_PATTERNS = [(re.compile(pat), msg) for pat, msg in _WARNING_SPECS]
+
+# Fused alternations - clean bash content (the overwhelmingly common case) is
+# cleared with a single scan; the individual patterns only re-run on a hit so
+# each finding keeps its specific message
+CRITICAL_RE = re.compile('|'.join(f'(?:{pat})' for pat, _ in _CRITICAL_SPECS), re.IGNORECASE)
+WARNING_RE = re.compile('|'.join(f'(?:{pat})' for pat, _ in _WARNING_SPECS))
+
+# Short aliases don't work in commands - map each to the version alias to suggest
+SHORT_MODEL_ALIASES = frozenset({'haiku', 'sonnet', 'opus', 'inherit'})
+VERSION_ALIAS_MAP = {
+    'haiku': 'claude-haiku-4-5',
+    'sonnet': 'claude-sonnet-4-5',
+    'opus': 'claude-opus-4-5',
+}
+
+
+def _split_frontmatter(content: str) -> tuple:
+    """Split frontmatter from body with linear string searches.
+
+    Returns (frontmatter_text, body); frontmatter_text is None when no
+    well-formed frontmatter block is present. str.find keeps the split O(n),
+    where the lazy DOTALL regex it replaces backtracked on large bodies.
+    """
+    if not content.startswith('---'):
+        return None, content
+    start = content.find('\n', 3) + 1
+    if start == 0 or content[3:start].strip():
+        return None, content
+    end = content.find('\n---\n', start)
+    if end < 0:
+        return None, content
+    return content[start:end], content[end + 5:]
+
+
+def _tool_set(value) -> frozenset:
+    """Normalize an allowed-tools value (str or list) into a frozenset of tool names."""
+    if isinstance(value, str):
+        return frozenset(t.strip() for t in value.split(',') if t.strip())
+    if isinstance(value, list):
+        return frozenset(str(t).strip() for t in value)
+    return frozenset()
+
 
 def validate_command(file_path: str) -> tuple[bool, list[str]]:
     """
@@ -30,20 +112,23 @@ def validate_command(file_path: str) -> tuple[bool, list[str]]:
     # Get command name from filename
     command_name = path.stem
 
-    # Validate filename
-    if not re.match(r'^[a-z0-9-]+$', command_name):
+    # Validate filename - single scan instead of a regex match plus substring checks
+    has_invalid_char = False
+    has_underscore = False
+    for char in command_name:
+        if char not in VALID_NAME_CHARS:
+            has_invalid_char = True
+            if char == '_':
+                has_underscore = True
+
+    if has_invalid_char or not command_name:
         errors.append(f"Invalid filename '{command_name}.md': must be lowercase letters, numbers, and hyphens only")
 
-    if '_' in command_name:
+    if has_underscore:
         errors.append(f"Invalid filename '{command_name}.md': underscores not allowed, use hyphens instead")
 
     # Check if name is action-oriented (starts with verb)
-    common_verbs = [
-        'add', 'build', 'check', 'clean', 'commit', 'create', 'delete', 'deploy',
-        'generate', 'get', 'install', 'list', 'make', 'push', 'remove', 'review',
-        'run', 'search', 'show', 'test', 'update', 'validate'
-    ]
-    if not any(command_name.startswith(verb) for verb in common_verbs):
+    if not command_name.startswith(COMMON_VERBS):
         errors.append(f"Recommendation: Command names are typically action-oriented (start with a verb): '{command_name}' → consider 'run-{command_name}', 'create-{command_name}', etc.")
 
     # Read file
@@ -53,18 +138,15 @@ def validate_command(file_path: str) -> tuple[bool, list[str]]:
         return False, [f"Failed to read file: {e}"]
 
     # Check for YAML frontmatter
-    frontmatter_pattern = r'^---\s*\n(.*?)\n---\s*\n'
-    match = re.match(frontmatter_pattern, content, re.DOTALL)
+    frontmatter_text, body = _split_frontmatter(content)
 
-    if not match:
+    if frontmatter_text is None:
         errors.append("Missing YAML frontmatter (must start with --- and end with ---)")
         return False, errors
 
-    frontmatter_text = match.group(1)
-
     # Parse YAML
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
+        frontmatter = yaml.load(frontmatter_text, Loader=YamlLoader)
     except yaml.YAMLError as e:
         errors.append(f"Invalid YAML syntax: {e}")
         return False, errors
@@ -97,14 +179,8 @@ def validate_command(file_path: str) -> tuple[bool, list[str]]:
         model_value = frontmatter['model']
 
         # Check if it's a SHORT alias (these DON'T work in commands)
-        if model_value in ['haiku', 'sonnet', 'opus', 'inherit']:
-            # Map short aliases to version aliases
-            version_alias_map = {
-                'haiku': 'claude-haiku-4-5',
-                'sonnet': 'claude-sonnet-4-5',
-                'opus': 'claude-opus-4-5'
-            }
-            suggested_version = version_alias_map.get(model_value, 'claude-sonnet-4-5')
+        if model_value in SHORT_MODEL_ALIASES:
+            suggested_version = VERSION_ALIAS_MAP.get(model_value, 'claude-sonnet-4-5')
 
             errors.append(
                 f"CRITICAL ERROR: Commands cannot use short aliases. "
@@ -137,12 +213,15 @@ def validate_command(file_path: str) -> tuple[bool, list[str]]:
         if not arg_hint.startswith('['):
             errors.append(f"Warning: argument-hint typically uses brackets: '{arg_hint}' → '[{arg_hint}]'")
 
-    # Check body content
-    body = content[match.end():]
-
-    # Check for argument usage
-    uses_positional = bool(re.search(r'\$\d+', body))
+    # Check for argument usage. The $ARGUMENTS substring test is cheap, so
+    # run it first; when it hits and an Arguments section exists, both
+    # recommendations below are already decided and the positional scan
+    # over the full body can be skipped
     uses_all_args = '$ARGUMENTS' in body
+    if uses_all_args and '## Arguments' in body:
+        uses_positional = False
+    else:
+        uses_positional = bool(POSITIONAL_ARG_RE.search(body))
 
     if uses_positional or uses_all_args:
         if 'argument-hint' not in frontmatter:
@@ -160,47 +239,36 @@ def validate_command(file_path: str) -> tuple[bool, list[str]]:
     if '## Example' not in body and '## Usage' not in body:
         errors.append("Recommendation: Add usage examples showing how to invoke the command")
 
-    # Security checks
-    if 'Bash' in frontmatter.get('allowed-tools', ''):
+    # Security checks - exact token membership so e.g. 'BashOutput' alone
+    # does not false-match as 'Bash'
+    if 'Bash' in _tool_set(frontmatter.get('allowed-tools', '')):
         # Extract bash code blocks for security analysis
         # Only analyze actual code, not documentation text
-        bash_blocks = re.findall(r'```(?:bash|sh)\n(.*?)```', body, re.DOTALL)
+        bash_blocks = BASH_BLOCK_RE.findall(body)
         bash_content = '\n'.join(bash_blocks)
 
-        # Check for dangerous patterns ONLY in bash code blocks - these are CRITICAL security issues
-        critical_patterns = [
-            (r'eval\s+\$', "SECURITY ERROR: Using eval with arguments enables arbitrary code execution"),
-            (r'rm\s+-rf\s+/\s*$', "SECURITY ERROR: rm -rf / detected - this will delete entire filesystem"),
-            (r'\|\s*bash\b', "SECURITY ERROR: Piping to bash enables arbitrary code execution"),
-            (r'curl.*\|\s*sh', "SECURITY ERROR: Piping curl to sh enables remote code execution"),
-            (r'wget.*\|\s*sh', "SECURITY ERROR: Piping wget to sh enables remote code execution"),
-        ]
-
-        for pattern, error_msg in critical_patterns:
-            if re.search(pattern, bash_content, re.IGNORECASE):
-                errors.append(error_msg)
+        if CRITICAL_RE.search(bash_content):
+            for pattern, error_msg in CRITICAL_PATTERNS:
+                if pattern.search(bash_content):
+                    errors.append(error_msg)
 
         # Check for warning-level patterns in bash code blocks
-        warning_patterns = [
-            (r'rm\s+-rf\s+\$', "Dangerous rm -rf with variable - ensure input validation before use"),
-            (r'\$\w+\s*(?:&&|\||;)', "Potential command injection - ensure variables are validated/quoted"),
-        ]
-
-        for pattern, warning in warning_patterns:
-            if re.search(pattern, bash_content):
-                errors.append(f"Warning: {warning}")
+        if WARNING_RE.search(bash_content):
+            for pattern, warning in WARNING_PATTERNS:
+                if pattern.search(bash_content):
+                    errors.append(f"Warning: {warning}")
 
         # Check for unvalidated positional args in bash code blocks
         for block in bash_blocks:
-            if re.search(r'\$[1-9]', block) or '$ARGUMENTS' in block:
+            if BASH_POSITIONAL_RE.search(block) or '$ARGUMENTS' in block:
                 # Check if validation appears before the variable usage
-                if not re.search(r'(validate|check|if\s+\[|test\s+)', block, re.IGNORECASE):
+                if not VALIDATION_HINT_RE.search(block):
                     errors.append(
                         "Warning: Bash code block uses $1, $2, or $ARGUMENTS without visible validation. "
                         "Consider adding input validation: if [[ -z \"$1\" ]]; then echo 'Error'; exit 1; fi"
                     )
 
-    return len([e for e in errors if not (e.startswith('Warning:') or e.startswith('Recommendation:'))]) == 0, errors
+    return len([e for e in errors if not e.startswith(('Warning:', 'Recommendation:'))]) == 0, errors
 
 
 def main():
@@ -215,8 +283,6 @@ def main():
         print(f"✓ Command '{command_file}' is valid!")
         sys.exit(0)
     else:
-        print(f"Validation results for '{command_file}':\n")
-
         critical_errors = []
         warnings = []
         recommendations = []
@@ -231,23 +297,25 @@ def main():
             else:
                 critical_errors.append(error)
 
+        # Build the report and flush it in one write
+        out = [f"Validation results for '{command_file}':", ""]
+
         if critical_errors:
-            print("❌ Critical Errors:")
-            for error in critical_errors:
-                print(f"   {error}")
-            print()
+            out.append("❌ Critical Errors:")
+            out.extend(f"   {error}" for error in critical_errors)
+            out.append("")
 
         if warnings:
-            print("⚠️  Warnings:")
-            for warning in warnings:
-                print(f"   {warning}")
-            print()
+            out.append("⚠️  Warnings:")
+            out.extend(f"   {warning}" for warning in warnings)
+            out.append("")
 
         if recommendations:
-            print("💡 Recommendations:")
-            for rec in recommendations:
-                print(f"   {rec}")
-            print()
+            out.append("💡 Recommendations:")
+            out.extend(f"   {rec}" for rec in recommendations)
+            out.append("")
+
+        sys.stdout.write('\n'.join(out) + '\n')
 
         sys.exit(1 if critical_errors else 0)
 
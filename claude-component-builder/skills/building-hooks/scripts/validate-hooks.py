@@ -4,6 +4,7 @@ Hooks validation script for Claude Code hooks configuration.
 Validates JSON syntax, event names, matchers, and hook structure.
 """
 
+import functools
 import json
 import sys
 import re
@@ -13,6 +14,34 @@ from pathlib import Path
 if sys.stdout.encoding != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
+# Valid event names; the tuple keeps the documented order for error
+# messages, the frozensets give hash-based membership tests
+VALID_EVENTS = (
+    'PreToolUse',
+    'PostToolUse',
+    'UserPromptSubmit',
+    'Stop',
+    'SessionStart',
+    'SessionEnd',
+    'Notification',
+    'SubagentStop',
+    'PreCompact'
+)
+_VALID_EVENTS = frozenset(VALID_EVENTS)
+
+# Events that require matchers
+TOOL_EVENTS = frozenset({'PreToolUse', 'PostToolUse'})
+
+# Events that should NOT have matchers
+LIFECYCLE_EVENTS = _VALID_EVENTS - TOOL_EVENTS
+
+
+@functools.lru_cache(maxsize=256)
+def _try_compile(matcher: str):
+    """Compile a matcher pattern, caching so repeated matchers across
+    events (e.g. 'Bash', 'Edit|Write') compile only once."""
+    return re.compile(matcher)
+
 
 def validate_hooks(file_path: str) -> tuple[bool, list[str]]:
     """
@@ -27,16 +56,17 @@ def validate_hooks(file_path: str) -> tuple[bool, list[str]]:
     if not path.exists():
         return False, [f"File does not exist: {file_path}"]
 
-    # Read file
+    # Read file - raw bytes, json.loads handles the UTF-8 decode itself
+    # so there is no separate text-mode decode and copy per file
     try:
-        content = path.read_text(encoding='utf-8')
+        content = path.read_bytes()
     except Exception as e:
         return False, [f"Failed to read file: {e}"]
 
     # Parse JSON
     try:
         config = json.loads(content)
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         return False, [f"Invalid JSON syntax: {e}"]
 
     # Check top-level structure
@@ -49,38 +79,16 @@ def validate_hooks(file_path: str) -> tuple[bool, list[str]]:
         errors.append("'hooks' field must be an object")
         return False, errors
 
-    # Valid event names
-    valid_events = [
-        'PreToolUse',
-        'PostToolUse',
-        'UserPromptSubmit',
-        'Stop',
-        'SessionStart',
-        'SessionEnd',
-        'Notification',
-        'SubagentStop',
-        'PreCompact'
-    ]
-
-    # Events that require matchers
-    tool_events = ['PreToolUse', 'PostToolUse']
-
-    # Events that should NOT have matchers
-    lifecycle_events = [
-        'UserPromptSubmit',
-        'Stop',
-        'SessionStart',
-        'SessionEnd',
-        'Notification',
-        'SubagentStop',
-        'PreCompact'
-    ]
+    # Cheap check first: an empty hooks object needs none of the event
+    # validation below, so answer the degenerate case immediately
+    if not hooks:
+        return True, ["Warning: No hooks defined (hooks object is empty)"]
 
     # Validate each event
     for event_name, event_hooks in hooks.items():
         # Check event name
-        if event_name not in valid_events:
-            errors.append(f"Invalid event name '{event_name}'. Valid events: {', '.join(valid_events)}")
+        if event_name not in _VALID_EVENTS:
+            errors.append(f"Invalid event name '{event_name}'. Valid events: {', '.join(VALID_EVENTS)}")
             continue
 
         # Check event hooks is a list
@@ -93,7 +101,7 @@ def validate_hooks(file_path: str) -> tuple[bool, list[str]]:
             hook_num = i + 1
 
             # Check for matcher field
-            if event_name in tool_events:
+            if event_name in TOOL_EVENTS:
                 if 'matcher' not in hook_config:
                     errors.append(f"Event '{event_name}' hook #{hook_num}: Missing required 'matcher' field")
                 else:
@@ -104,11 +112,11 @@ def validate_hooks(file_path: str) -> tuple[bool, list[str]]:
 
                     # Try to compile as regex
                     try:
-                        re.compile(matcher)
+                        _try_compile(matcher)
                     except re.error as e:
                         errors.append(f"Event '{event_name}' hook #{hook_num}: Invalid regex in matcher '{matcher}': {e}")
 
-            elif event_name in lifecycle_events:
+            elif event_name in LIFECYCLE_EVENTS:
                 if 'matcher' in hook_config and hook_config['matcher']:
                     errors.append(f"Event '{event_name}' hook #{hook_num}: Should not have 'matcher' field (lifecycle events don't use matchers)")
 
@@ -141,14 +149,24 @@ def validate_hooks(file_path: str) -> tuple[bool, list[str]]:
                             errors.append(f"Event '{event_name}' hook #{hook_num}, item #{hook_item_num}: Empty command")
 
                         # Check if script file exists (if it looks like a file path)
-                        if command.startswith('bash ') or command.startswith('sh '):
-                            script_path = command.split()[1] if len(command.split()) > 1 else None
+                        # startswith takes a tuple, so both prefixes are
+                        # checked in one C-level call
+                        if command.startswith(('bash ', 'sh ')):
+                            # Tokenize once - the old code split the same
+                            # command twice to extract one token
+                            parts = command.split()
+                            script_path = parts[1] if len(parts) > 1 else None
                             if script_path and script_path.startswith('/'):
-                                script_file = Path(script_path)
-                                if not script_file.exists():
+                                # One stat() answers both existence and the
+                                # mode check; exists() + stat() was two
+                                # syscalls per referenced script
+                                try:
+                                    mode = Path(script_path).stat().st_mode
+                                except OSError:
                                     errors.append(f"Warning: Script file does not exist: {script_path}")
-                                elif not script_file.stat().st_mode & 0o111:
-                                    errors.append(f"Warning: Script file is not executable: {script_path}")
+                                else:
+                                    if not mode & 0o111:
+                                        errors.append(f"Warning: Script file is not executable: {script_path}")
 
                 elif hook_type == 'prompt':
                     if 'prompt' not in hook:
@@ -161,26 +179,41 @@ def validate_hooks(file_path: str) -> tuple[bool, list[str]]:
                 else:
                     errors.append(f"Event '{event_name}' hook #{hook_num}, item #{hook_item_num}: Invalid type '{hook_type}'. Valid types: 'command', 'prompt'")
 
-    # Check for common mistakes
-    if not hooks:
-        errors.append("Warning: No hooks defined (hooks object is empty)")
-
     return len([e for e in errors if not e.startswith('Warning:')]) == 0, errors
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: validate-hooks.py <hooks.json>")
+    # --json emits a one-line machine-readable summary so callers can
+    # json.loads the result instead of scraping the human-readable report
+    as_json = '--json' in sys.argv[1:]
+    args = [a for a in sys.argv[1:] if a != '--json']
+
+    if not args:
+        print("Usage: validate-hooks.py <hooks.json> [--json]")
         sys.exit(1)
 
-    hooks_file = sys.argv[1]
+    hooks_file = args[0]
     is_valid, errors = validate_hooks(hooks_file)
 
+    if as_json:
+        warnings = [e for e in errors if e.startswith('Warning:')]
+        critical = [e for e in errors if not e.startswith('Warning:')]
+        print(json.dumps({
+            'file': hooks_file,
+            'valid': is_valid,
+            'critical': len(critical),
+            'warnings': len(warnings),
+            'errors': errors,
+        }))
+        sys.exit(0 if is_valid else 1)
+
     if is_valid and not errors:
         print(f"✓ Hooks configuration '{hooks_file}' is valid!")
         sys.exit(0)
     else:
-        print(f"Validation results for '{hooks_file}':\n")
+        # Buffer the report and flush once - one print per error pays
+        # stdout locking and flushing for every line
+        out = [f"Validation results for '{hooks_file}':", ""]
 
         critical_errors = []
         warnings = []
@@ -192,17 +225,16 @@ def main():
                 critical_errors.append(error)
 
         if critical_errors:
-            print("❌ Critical Errors:")
-            for error in critical_errors:
-                print(f"   {error}")
-            print()
+            out.append("❌ Critical Errors:")
+            out.extend(f"   {error}" for error in critical_errors)
+            out.append("")
 
         if warnings:
-            print("⚠️  Warnings:")
-            for warning in warnings:
-                print(f"   {warning}")
-            print()
+            out.append("⚠️  Warnings:")
+            out.extend(f"   {warning}" for warning in warnings)
+            out.append("")
 
+        sys.stdout.write('\n'.join(out) + '\n')
         sys.exit(1 if critical_errors else 0)
 
 
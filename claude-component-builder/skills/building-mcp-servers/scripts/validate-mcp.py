@@ -77,7 +77,7 @@ def validate_server_config(name, config, errors, warnings, recommendations):
             url = config['url']
             # Check for secure protocols
             if server_type == 'websocket':
-                if not url.startswith('wss://') and not url.startswith('${'):
+                if not url.startswith(('wss://', '${')):
                     warnings.append(f"Server '{name}': WebSocket URL should use 'wss://' for security")
             else:
                 if url.startswith('http://') and 'localhost' not in url and '127.0.0.1' not in url:
@@ -120,11 +120,10 @@ def validate_mcp_config(file_path):
         print_error(f"File not found: {file_path}")
         return 1
 
-    # Read and parse JSON
+    # Read and parse JSON - raw bytes, json.loads handles the UTF-8
+    # decode itself so there is no separate text-mode decode and copy
     try:
-        with open(path, 'r') as f:
-            content = f.read()
-            config = json.loads(content)
+        config = json.loads(path.read_bytes())
     except json.JSONDecodeError as e:
         print_error(f"Invalid JSON: {e}")
         return 1
@@ -9,10 +9,34 @@ import sys
 import yaml
 from pathlib import Path
 
+# Prefer the libyaml-backed loader when available - frontmatter is parsed once
+# per validated skill and the C loader is an order of magnitude faster
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # Ensure UTF-8 output for Unicode characters on Windows
 if sys.stdout.encoding != 'utf-8':
     sys.stdout.reconfigure(encoding='utf-8')
 
+# Markers that indicate a gerund-form name - built once instead of
+# rebuilding the list on every validation call
+GERUND_MARKERS = (
+    '-ing-', 'analyzing', 'building', 'creating',
+    'generating', 'processing', 'writing'
+)
+
+# Allowed field values and trigger keywords, built once at import rather
+# than on every validation call
+TRIGGER_KEYWORDS = ('use when', 'when', 'for', 'whenever', 'if')
+VALID_TOOLS = (
+    'Read', 'Write', 'Edit', 'Grep', 'Glob', 'Bash',
+    'WebFetch', 'WebSearch', 'NotebookEdit', 'Task',
+    'TodoWrite', 'BashOutput', 'KillShell'
+)
+VALID_SUBDIRS = ('scripts', 'references', 'assets')
+
 
 def validate_skill(skill_dir: str) -> tuple[bool, list[str]]:
     """
@@ -55,7 +79,7 @@ def validate_skill(skill_dir: str) -> tuple[bool, list[str]]:
 
     # Parse YAML
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
+        frontmatter = yaml.load(frontmatter_text, Loader=YamlLoader)
     except yaml.YAMLError as e:
         errors.append(f"Invalid YAML syntax in SKILL.md: {e}")
         return False, errors
@@ -87,7 +111,7 @@ def validate_skill(skill_dir: str) -> tuple[bool, list[str]]:
             errors.append(f"Warning: Skill name '{name}' does not match directory name '{skill_path.name}'")
 
         # Recommend gerund form for skills
-        if not name.endswith('ing') and not any(word in name for word in ['-ing-', 'analyzing', 'building', 'creating', 'generating', 'processing', 'writing']):
+        if not name.endswith('ing') and not any(word in name for word in GERUND_MARKERS):
             errors.append(f"Recommendation: Skill names typically use gerund form (verb + -ing): '{name}' → consider 'building-{name}' or '{name}ing'")
 
     if 'description' not in frontmatter:
@@ -104,8 +128,7 @@ def validate_skill(skill_dir: str) -> tuple[bool, list[str]]:
             errors.append(f"Warning: Description is very short ({len(description)} chars). For skills, describe WHEN Claude should auto-invoke.")
 
         # Check for auto-invocation triggers
-        trigger_keywords = ['use when', 'when', 'for', 'whenever', 'if']
-        if not any(keyword in description.lower() for keyword in trigger_keywords):
+        if not any(keyword in description.lower() for keyword in TRIGGER_KEYWORDS):
             errors.append("Recommendation: Skill description should clearly state WHEN Claude should use it (e.g., 'Use when...')")
 
     # Validate optional fields
@@ -116,11 +139,6 @@ def validate_skill(skill_dir: str) -> tuple[bool, list[str]]:
 
     if 'allowed-tools' in frontmatter:
         tools = frontmatter['allowed-tools']
-        valid_tools = [
-            'Read', 'Write', 'Edit', 'Grep', 'Glob', 'Bash',
-            'WebFetch', 'WebSearch', 'NotebookEdit', 'Task',
-            'TodoWrite', 'BashOutput', 'KillShell'
-        ]
 
         # Check if using wrong YAML list format instead of comma-separated string
         if isinstance(tools, list):
@@ -138,8 +156,8 @@ def validate_skill(skill_dir: str) -> tuple[bool, list[str]]:
         elif isinstance(tools, str):
             tool_list = [t.strip() for t in tools.split(',')]
             for tool in tool_list:
-                if tool not in valid_tools:
-                    errors.append(f"Warning: Unknown tool '{tool}'. Valid tools: {', '.join(valid_tools)}")
+                if tool not in VALID_TOOLS:
+                    errors.append(f"Warning: Unknown tool '{tool}'. Valid tools: {', '.join(VALID_TOOLS)}")
 
     # Skills do not support the 'model' field - only agents support it
     if 'model' in frontmatter:
@@ -150,10 +168,13 @@ def validate_skill(skill_dir: str) -> tuple[bool, list[str]]:
     if len(body.strip()) < 100:
         errors.append("Warning: Skill body is very short. Consider adding detailed instructions and examples.")
 
+    # One directory listing serves the {baseDir} check here and the
+    # structure check below instead of four separate iterdir scans
+    skill_entries = list(skill_path.iterdir())
+    entry_names = {p.name for p in skill_entries}
+
     # Check for {baseDir} usage
-    if 'scripts' in [p.name for p in skill_path.iterdir()] or \
-       'references' in [p.name for p in skill_path.iterdir()] or \
-       'assets' in [p.name for p in skill_path.iterdir()]:
+    if not entry_names.isdisjoint(VALID_SUBDIRS):
         if '{baseDir}' not in body:
             errors.append("Recommendation: Use {baseDir} variable to reference resources in scripts/, references/, or assets/")
 
@@ -165,10 +186,9 @@ def validate_skill(skill_dir: str) -> tuple[bool, list[str]]:
         errors.append("Recommendation: Add a capabilities section to document what the skill can do")
 
     # Check directory structure
-    valid_subdirs = ['scripts', 'references', 'assets']
-    for subdir in skill_path.iterdir():
-        if subdir.is_dir() and subdir.name not in valid_subdirs and not subdir.name.startswith('.'):
-            errors.append(f"Warning: Unexpected subdirectory '{subdir.name}'. Standard subdirs: {', '.join(valid_subdirs)}")
+    for subdir in skill_entries:
+        if subdir.is_dir() and subdir.name not in VALID_SUBDIRS and not subdir.name.startswith('.'):
+            errors.append(f"Warning: Unexpected subdirectory '{subdir.name}'. Standard subdirs: {', '.join(VALID_SUBDIRS)}")
 
     # Check if scripts are executable
     scripts_dir = skill_path / 'scripts'
@@ -178,7 +198,7 @@ def validate_skill(skill_dir: str) -> tuple[bool, list[str]]:
                 if not script.stat().st_mode & 0o111:
                     errors.append(f"Warning: Script '{script.name}' is not executable. Run: chmod +x {script}")
 
-    return len([e for e in errors if not (e.startswith('Warning:') or e.startswith('Recommendation:'))]) == 0, errors
+    return len([e for e in errors if not e.startswith(('Warning:', 'Recommendation:'))]) == 0, errors
 
 
 def main():
@@ -6,6 +6,7 @@ Bumps version numbers in package.json, plugin.json, and other version files.
 
 import argparse
 import json
+import os
 import re
 import sys
 from pathlib import Path
@@ -72,24 +73,38 @@ def update_json_file(filepath: Path, version: str, dry_run: bool = False) -> boo
         return False
 
 
+# Nested version files matched anywhere in the tree; package.json is only
+# looked for at the project root
+VERSION_FILE_NAMES = frozenset({'plugin.json', 'marketplace.json'})
+
+
 def find_version_files(root: Path) -> list[Path]:
     """Find all version files in the project."""
-    version_files = []
-
-    # Common version file patterns
-    patterns = [
-        'package.json',
-        '**/plugin.json',
-        '**/.claude-plugin/plugin.json',
-        '**/marketplace.json',
-    ]
-
-    for pattern in patterns:
-        for filepath in root.glob(pattern):
-            if filepath.is_file() and not any(part.startswith('.git') for part in filepath.parts):
-                version_files.append(filepath)
-
-    return sorted(set(version_files))
+    # One scandir walk instead of overlapping glob patterns: each pattern
+    # re-traversed the tree and stat'd every entry, and the results then
+    # needed dedup. scandir reports file/dir type from the directory read,
+    # visits each path once, and lets .git* trees be pruned outright.
+    found = []
+
+    package_json = root / 'package.json'
+    if package_json.is_file():
+        found.append(str(package_json))
+
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith('.git'):
+                        stack.append(entry.path)
+                elif entry.name in VERSION_FILE_NAMES and entry.is_file(follow_symlinks=False):
+                    found.append(entry.path)
+
+    return [Path(p) for p in sorted(found)]
 
 
 def get_current_version(root: Path) -> Optional[str]:
@@ -20,6 +20,10 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+# Characters allowed through branch-name cleaning; space and underscore are
+# kept here because they are mapped to hyphens rather than dropped
+BRANCH_NAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789- _")
+
 
 def run_git(args: list, capture: bool = True, check: bool = True) -> str:
     """Run a git command and return output."""
@@ -163,9 +167,13 @@ def generate_branch_name(branch_type: str, name: str, issue: Optional[int], conf
     # Store original for error message
     original_name = name
 
-    # Clean the name
-    name = name.lower().replace(" ", "-").replace("_", "-")
-    name = re.sub(r"[^a-z0-9-]", "", name)
+    # Clean the name in a single pass: spaces/underscores map to hyphens,
+    # anything else outside [a-z0-9-] is dropped
+    name = "".join(
+        "-" if c in " _" else c
+        for c in name.lower()
+        if c in BRANCH_NAME_CHARS
+    )
     name = name.strip("-")  # Remove leading/trailing hyphens
 
     # Validate name is not empty after cleaning
@@ -11,6 +11,11 @@ import sys
 
 VALID_TYPES = ['feat', 'fix', 'docs', 'style', 'refactor', 'perf', 'test', 'chore', 'ci', 'build', 'revert']
 
+# Prefix tuples built once - startswith accepts a tuple, so each subject
+# is checked in a single call instead of two per type
+TYPE_PREFIXES = tuple(f'{t}{c}' for t in VALID_TYPES for c in (':', '('))
+PAST_TENSE_PREFIXES = tuple(f'{t}ed ' for t in VALID_TYPES)
+
 RED = '\033[0;31m'
 GREEN = '\033[0;32m'
 YELLOW = '\033[1;33m'
@@ -18,7 +23,7 @@ BLUE = '\033[0;34m'
 NC = '\033[0m'
 
 
-def run_git(args):
+def run_git(args: list[str]) -> str:
     """Execute git command"""
     try:
         result = subprocess.run(['git'] + args, capture_output=True, text=True, check=True)
@@ -28,7 +33,7 @@ def run_git(args):
         return ""
 
 
-def validate_message(message):
+def validate_message(message: str) -> tuple[bool, list[str]]:
     """Validate a commit message"""
     lines = message.strip().split('\n')
     subject = lines[0]
@@ -36,8 +41,7 @@ def validate_message(message):
     issues = []
 
     # Check type
-    has_valid_type = any(subject.startswith(t + ':') or subject.startswith(t + '(') for t in VALID_TYPES)
-    if not has_valid_type:
+    if not subject.startswith(TYPE_PREFIXES):
         issues.append(f"Missing valid type. Use one of: {', '.join(VALID_TYPES)}")
 
     # Check subject length
@@ -49,7 +53,7 @@ def validate_message(message):
         issues.append("Subject should not end with period")
 
     # Check imperative mood (basic heuristic)
-    if any(subject.lower().startswith(t + 'ed ') for t in VALID_TYPES):
+    if subject.lower().startswith(PAST_TENSE_PREFIXES):
         issues.append("Use imperative mood ('add' not 'added')")
 
     return len(issues) == 0, issues
@@ -189,14 +193,14 @@ def interactive():
         print("Cancelled")
 
 
-def validate_branch(branch):
+def validate_branch(branch: str) -> None:
     """Validate all commits on a branch"""
     # Get commits
     commits = run_git(['log', f'main...{branch}', '--format=%H|%s']).split('\n')
 
-    print(f"\n{'='*60}")
-    print(f"Validating commits on {branch}")
-    print(f"{'='*60}\n")
+    # Buffer the per-commit lines and flush once - one print per commit
+    # pays stdout locking and flushing for every line on long branches
+    out = [f"\n{'='*60}", f"Validating commits on {branch}", f"{'='*60}\n"]
 
     valid = 0
     invalid = 0
@@ -209,16 +213,17 @@ def validate_branch(branch):
         is_valid, issues = validate_message(subject)
 
         if is_valid:
-            print(f"{GREEN}✓{NC} {commit_hash[:7]}: {subject}")
+            out.append(f"{GREEN}✓{NC} {commit_hash[:7]}: {subject}")
             valid += 1
         else:
-            print(f"{RED}✗{NC} {commit_hash[:7]}: {subject}")
+            out.append(f"{RED}✗{NC} {commit_hash[:7]}: {subject}")
             for issue in issues:
-                print(f"  - {issue}")
+                out.append(f"  - {issue}")
             invalid += 1
 
     total = valid + invalid
-    print(f"\nValid: {valid}/{total} ({valid/total*100:.0f}%)")
+    out.append(f"\nValid: {valid}/{total} ({valid/total*100:.0f}%)")
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 def main():
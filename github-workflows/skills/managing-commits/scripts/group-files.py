@@ -290,11 +290,12 @@ def main():
     # Group files
     if args.mode == 'scope':
         scope_groups = group_files_by_scope(files)
-        print(f"\n{BLUE}Files grouped by scope:{NC}\n")
+        # Collect lines and flush once - one write instead of a print per file
+        out = [f"\n{BLUE}Files grouped by scope:{NC}\n"]
         for scope, scope_files in scope_groups.items():
-            print(f"{GREEN}{scope}:{NC} {len(scope_files)} files")
-            for f in scope_files:
-                print(f"  - {f['path']}")
+            out.append(f"{GREEN}{scope}:{NC} {len(scope_files)} files")
+            out.extend(f"  - {f['path']}" for f in scope_files)
+        sys.stdout.write('\n'.join(out) + '\n')
     else:
         groups = group_files_by_type_and_scope(files)
 
@@ -307,11 +308,12 @@ def main():
             }
             print(json.dumps(output, indent=2))
         else:
-            # Human-readable output
-            print(f"\n{BLUE}Found {len(files)} changed files in {len(groups)} logical groups:{NC}\n")
+            # Human-readable output, batched into a single write
+            out = [f"\n{BLUE}Found {len(files)} changed files in {len(groups)} logical groups:{NC}\n"]
             for i, group in enumerate(groups, 1):
-                print(format_group_display(group, i))
-                print()
+                out.append(format_group_display(group, i))
+                out.append('')
+            sys.stdout.write('\n'.join(out) + '\n')
 
     return 0
 
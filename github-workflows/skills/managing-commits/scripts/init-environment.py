@@ -207,6 +207,7 @@ def get_branch_info(suggested_scopes=None):
 
     # Extract issue numbers from branch name (can have multiple)
     issue_numbers = []
+    seen = set()
     patterns = [
         r"issue-(\d+)",
         r"/(\d+)-",
@@ -218,7 +219,10 @@ def get_branch_info(suggested_scopes=None):
         matches = re.findall(pattern, branch_name)
         for match in matches:
             num = int(match)
-            if num not in issue_numbers:
+            # Set membership keeps dedupe O(1) per match; the list
+            # preserves first-seen order for the output
+            if num not in seen:
+                seen.add(num)
                 issue_numbers.append(num)
 
     # Detect scope from branch name
@@ -46,8 +46,11 @@ def assess_research_completeness(text: str) -> Dict[str, any]:
     metrics['has_organization'] = (bullet_points >= 5 or numbered_lists >= 3) and headings >= 3
 
     # 5. Actionability
+    # Lowercase once - counting inline would re-lowercase the full text
+    # for every keyword
+    text_lower = text.lower()
     action_keywords = ['recommend', 'suggest', 'should', 'consider', 'next steps', 'todo', 'follow-up']
-    action_count = sum(text.lower().count(keyword) for keyword in action_keywords)
+    action_count = sum(text_lower.count(keyword) for keyword in action_keywords)
     metrics['actionable'] = action_count >= 3
 
     # 6. Breadth vs Depth Balance
@@ -18,7 +18,8 @@ import os
 import re
 import sys
 import json
-import yaml
+import atexit
+import pickle
 import hashlib
 import argparse
 from pathlib import Path
@@ -32,6 +33,51 @@ CATEGORIES = ['investigations', 'best-practices', 'patterns', 'comparisons']
 # Default cache expiry (30 days)
 DEFAULT_EXPIRY_DAYS = 30
 
+# Topic slug normalization (compiled once, used per cache entry)
+SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+
+def _atomic_write(path: Path, text: str):
+    """Write text via a same-directory temp file and a single os.replace.
+
+    Re-caching an existing topic replaces the entry atomically instead of
+    truncating it first.
+    """
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+# Parsed (metadata, content) keyed by path with an mtime fast path and a
+# content-hash fallback, persisted with pickle so list/search/stats runs
+# skip reparsing unchanged entries. The hash catches files whose mtime
+# moved without a content change (touch, checkout, copy back)
+PARSE_CACHE_PATH = CACHE_DIR / '.parse-cache.pkl'
+_parse_cache = None
+_parse_cache_dirty = False
+
+def _get_parse_cache() -> Dict:
+    """Load the persisted parse cache, treating any problem as empty."""
+    global _parse_cache
+    if _parse_cache is None:
+        try:
+            with open(PARSE_CACHE_PATH, 'rb') as f:
+                _parse_cache = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            _parse_cache = {}
+        atexit.register(_save_parse_cache)
+    return _parse_cache
+
+def _save_parse_cache():
+    """Persist the parse cache if this run added or refreshed entries."""
+    if not _parse_cache_dirty:
+        return
+    try:
+        PARSE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(PARSE_CACHE_PATH, 'wb') as f:
+            pickle.dump(_parse_cache, f)
+    except OSError:
+        pass
+
 class CacheEntry:
     """Represents a cached research entry"""
 
@@ -43,17 +89,48 @@ class CacheEntry:
 
     def _load(self):
         """Load entry from file"""
-        if not self.filepath.exists():
+        global _parse_cache_dirty
+
+        try:
+            mtime_ns = self.filepath.stat().st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(f"Cache file not found: {self.filepath}")
 
-        text = self.filepath.read_text()
+        cache = _get_parse_cache()
+        key = str(self.filepath)
+        cached = cache.get(key)
+        if cached is not None and len(cached) != 4:
+            cached = None  # entry from the pre-hash cache layout
+        if cached is not None and cached[0] == mtime_ns:
+            self.metadata, self.content = cached[2], cached[3]
+            return
+
+        raw = self.filepath.read_bytes()
+        digest = hashlib.sha1(raw).hexdigest()
+        if cached is not None and cached[1] == digest:
+            # mtime moved but the bytes did not; reuse the parse and
+            # refresh the stored mtime so the fast path hits next run
+            self.metadata, self.content = cached[2], cached[3]
+            cache[key] = (mtime_ns, digest, self.metadata, self.content)
+            _parse_cache_dirty = True
+            return
+
+        # Deferred: yaml costs ~50ms to import and fast-exit subcommands
+        # (help, path lookups) never parse frontmatter
+        import yaml
+        try:
+            from yaml import CSafeLoader as YamlLoader
+        except ImportError:
+            from yaml import SafeLoader as YamlLoader
+
+        text = raw.decode()
 
         # Extract YAML frontmatter
         if text.startswith('---\n'):
             parts = text.split('---\n', 2)
             if len(parts) >= 3:
                 try:
-                    self.metadata = yaml.safe_load(parts[1])
+                    self.metadata = yaml.load(parts[1], Loader=YamlLoader)
                     self.content = parts[2].strip()
                 except yaml.YAMLError as e:
                     print(f"Warning: Could not parse YAML frontmatter: {e}")
@@ -63,6 +140,9 @@ class CacheEntry:
         else:
             self.content = text
 
+        cache[key] = (mtime_ns, digest, self.metadata, self.content)
+        _parse_cache_dirty = True
+
     @property
     def cache_id(self) -> str:
         """Get cache ID (filename without extension)"""
@@ -175,12 +255,18 @@ def add_entry(category: str, topic: str, source_file: Path,
               tags: List[str] = None, related_files: List[str] = None,
               codebase_hash: str = None) -> Path:
     """Add a new cache entry"""
+    import yaml
+    try:
+        from yaml import CSafeDumper as YamlDumper
+    except ImportError:
+        from yaml import SafeDumper as YamlDumper
+
     if category not in CATEGORIES:
         raise ValueError(f"Invalid category: {category}. Must be one of {CATEGORIES}")
 
     # Generate cache ID
     date_str = datetime.now().strftime('%Y-%m-%d')
-    topic_slug = re.sub(r'[^a-z0-9]+', '-', topic.lower()).strip('-')
+    topic_slug = SLUG_RE.sub('-', topic.lower()).strip('-')
     cache_id = f"{topic_slug}-{date_str}"
 
     # Read source content
@@ -209,8 +295,8 @@ def add_entry(category: str, topic: str, source_file: Path,
     cache_file = cat_dir / f"{cache_id}.md"
 
     # Write with YAML frontmatter
-    yaml_str = yaml.dump(metadata, default_flow_style=False, sort_keys=False)
-    cache_file.write_text(f"---\n{yaml_str}---\n\n{content}")
+    yaml_str = yaml.dump(metadata, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
+    _atomic_write(cache_file, f"---\n{yaml_str}---\n\n{content}")
 
     return cache_file
 
@@ -7,6 +7,7 @@ Usage: python check-evidence.py <research-output-file> [--codebase-dir <dir>]
 import re
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 
@@ -87,9 +88,16 @@ def main():
     valid_count = 0
     invalid_refs = []
 
-    for filepath, line_range in references:
-        is_valid, message = validate_file_reference(filepath, line_range, codebase_dir)
+    # Each reference stats and reads its target file, so validation is
+    # I/O-bound; overlap the reads across a thread pool and report in
+    # the original reference order
+    def _validate(ref):
+        return validate_file_reference(ref[0], ref[1], codebase_dir)
 
+    with ThreadPoolExecutor(max_workers=min(32, len(references))) as executor:
+        results = list(executor.map(_validate, references))
+
+    for (filepath, line_range), (is_valid, message) in zip(references, results):
         if is_valid:
             valid_count += 1
             print(f"  ✓ `{filepath}:{line_range}` - {message}")
@@ -18,7 +18,6 @@ import os
 import re
 import sys
 import json
-import yaml
 import argparse
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -30,6 +29,60 @@ LEARNING_DIR = Path(__file__).parent.parent / '.learning-log'
 INDEX_FILE = LEARNING_DIR / 'index.json'
 TAGS_FILE = LEARNING_DIR / 'tags.json'
 
+# Topic slug normalization (compiled once, used per learning entry)
+SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+
+def _atomic_write(path: Path, text: str):
+    """Write text to path via a same-directory temp file and os.replace.
+
+    Readers never observe a missing or half-written file - the final
+    mutation is a single atomic rename.
+    """
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+# Key Insight section extraction (compiled once; searched with a bounded
+# window first since the section sits near the top by template convention)
+KEY_INSIGHT_RE = re.compile(r'##\s*Key Insight\s*\n(.+?)(?=\n##)', re.DOTALL)
+
+# Fallback entry template, used when assets/learning-entry-template.md is
+# missing. Module-level so add_learning does not rebuild the literal per call.
+FALLBACK_TEMPLATE = """---
+date: {date}
+topic: {topic}
+source: {source}
+tags: {tags}
+confidence: {confidence}
+applied: false
+reviewed_count: 0
+last_reviewed: null
+---
+
+# What I Learned
+
+## Key Insight
+[Your key insight here]
+
+## Why It Matters
+[Why this is important]
+
+## How to Apply
+[Practical application]
+
+## Related Learnings
+[Related topics]
+
+## Questions to Explore
+[Follow-up questions]
+
+## Status Checklist
+- [ ] Understood concept
+- [ ] Applied in code
+- [ ] Reviewed and retained
+"""
+
 class LearningEntry:
     """Represents a learning log entry"""
 
@@ -37,22 +90,34 @@ class LearningEntry:
         self.filepath = filepath
         self.metadata = {}
         self.content = ""
+        self.raw_text = ""
+        self.frontmatter_parsed = False
         self._load()
 
     def _load(self):
         """Load entry from file"""
+        # Deferred: yaml costs ~50ms to import and fast-exit subcommands
+        # (help, path lookups) never parse frontmatter
+        import yaml
+        try:
+            from yaml import CSafeLoader as YamlLoader
+        except ImportError:
+            from yaml import SafeLoader as YamlLoader
+
         if not self.filepath.exists():
             raise FileNotFoundError(f"Learning file not found: {self.filepath}")
 
         text = self.filepath.read_text()
+        self.raw_text = text
 
         # Extract YAML frontmatter
         if text.startswith('---\n'):
             parts = text.split('---\n', 2)
             if len(parts) >= 3:
                 try:
-                    self.metadata = yaml.safe_load(parts[1])
+                    self.metadata = yaml.load(parts[1], Loader=YamlLoader)
                     self.content = parts[2].strip()
+                    self.frontmatter_parsed = True
                 except yaml.YAMLError as e:
                     print(f"Warning: Could not parse YAML frontmatter: {e}")
                     self.content = text
@@ -110,7 +175,10 @@ class LearningEntry:
     @property
     def key_insight(self) -> str:
         """Extract key insight from content"""
-        match = re.search(r'##\s*Key Insight\s*\n(.+?)(?=\n##)', self.content, re.DOTALL)
+        # Only 200 chars are kept, so scan the first 4KB and fall back to a
+        # full search only when the section is not in the prefix
+        match = (KEY_INSIGHT_RE.search(self.content, 0, 4096)
+                 or KEY_INSIGHT_RE.search(self.content))
         if match:
             return match.group(1).strip()[:200]  # First 200 chars
         return ""
@@ -134,26 +202,52 @@ class LearningEntry:
         return False
 
 
+def _learning_files() -> List[Path]:
+    """Enumerate <month>/<entry>.md files with a single scandir walk.
+
+    scandir reuses the file type from the directory entries, avoiding the
+    extra stat per path that the nested pathlib globs issued.
+    """
+    files = []
+    try:
+        month_dirs = os.scandir(LEARNING_DIR)
+    except OSError:
+        return files
+
+    with month_dirs:
+        months = sorted(
+            (m for m in month_dirs
+             if '-' in m.name and not m.name.startswith('.')
+             and m.is_dir(follow_symlinks=False)),
+            key=lambda m: m.name, reverse=True)
+
+    for month in months:
+        try:
+            month_entries = os.scandir(month.path)
+        except OSError:
+            continue
+        with month_entries:
+            files.extend(Path(e.path) for e in sorted(month_entries, key=lambda e: e.name)
+                         if e.name.endswith('.md') and not e.name.startswith('.')
+                         and e.is_file(follow_symlinks=False))
+    return files
+
+
 def list_learnings(tag: Optional[str] = None, recent: Optional[int] = None) -> List[LearningEntry]:
     """List all learning entries"""
     entries = []
 
-    # Search all month directories
-    for month_dir in sorted(LEARNING_DIR.glob('*-*'), reverse=True):
-        if not month_dir.is_dir():
-            continue
-
-        for file in month_dir.glob('*.md'):
-            try:
-                entry = LearningEntry(file)
+    for file in _learning_files():
+        try:
+            entry = LearningEntry(file)
 
-                # Filter by tag if specified
-                if tag and tag not in entry.tags:
-                    continue
+            # Filter by tag if specified
+            if tag and tag not in entry.tags:
+                continue
 
-                entries.append(entry)
-            except Exception as e:
-                print(f"Warning: Could not load {file}: {e}", file=sys.stderr)
+            entries.append(entry)
+        except Exception as e:
+            print(f"Warning: Could not load {file}: {e}", file=sys.stderr)
 
     # Sort by date (newest first)
     entries.sort(key=lambda e: e.date or datetime.min, reverse=True)
@@ -187,9 +281,15 @@ def show_learning(learning_id: str) -> Optional[LearningEntry]:
 
 def add_learning(topic: str, tags: List[str] = None, source: str = None, confidence: str = 'medium') -> Path:
     """Add a new learning entry"""
+    import yaml
+    try:
+        from yaml import CSafeDumper as YamlDumper
+    except ImportError:
+        from yaml import SafeDumper as YamlDumper
+
     # Generate learning ID
     date_str = datetime.now().strftime('%Y-%m-%d')
-    topic_slug = re.sub(r'[^a-z0-9]+', '-', topic.lower()).strip('-')
+    topic_slug = SLUG_RE.sub('-', topic.lower()).strip('-')
     learning_id = f"{topic_slug}-{date_str}"
 
     # Create month directory
@@ -202,39 +302,7 @@ def add_learning(topic: str, tags: List[str] = None, source: str = None, confide
     if template_path.exists():
         template = template_path.read_text()
     else:
-        template = """---
-date: {date}
-topic: {topic}
-source: {source}
-tags: {tags}
-confidence: {confidence}
-applied: false
-reviewed_count: 0
-last_reviewed: null
----
-
-# What I Learned
-
-## Key Insight
-[Your key insight here]
-
-## Why It Matters
-[Why this is important]
-
-## How to Apply
-[Practical application]
-
-## Related Learnings
-[Related topics]
-
-## Questions to Explore
-[Follow-up questions]
-
-## Status Checklist
-- [ ] Understood concept
-- [ ] Applied in code
-- [ ] Reviewed and retained
-"""
+        template = FALLBACK_TEMPLATE
 
     # Fill template
     metadata = {
@@ -248,7 +316,7 @@ last_reviewed: null
         'last_reviewed': None
     }
 
-    yaml_str = yaml.dump(metadata, default_flow_style=False, sort_keys=False)
+    yaml_str = yaml.dump(metadata, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
     content = template.format(
         date=date_str,
         topic=topic,
@@ -284,8 +352,11 @@ def get_stats() -> Dict:
     current_month = datetime.now().strftime('%Y-%m')
 
     for entry in entries:
+        # Format the month once and reuse it for both counters below
+        month_key = entry.date.strftime('%Y-%m') if entry.date else None
+
         # Count this month
-        if entry.date and entry.date.strftime('%Y-%m') == current_month:
+        if month_key == current_month:
             stats['this_month'] += 1
 
         # Count applied
@@ -301,8 +372,7 @@ def get_stats() -> Dict:
             stats['by_tag'][tag] += 1
 
         # Count by month
-        if entry.date:
-            month_key = entry.date.strftime('%Y-%m')
+        if month_key:
             stats['by_month'][month_key] += 1
 
         # Count by confidence
@@ -313,19 +383,32 @@ def get_stats() -> Dict:
 
 def mark_applied(learning_id: str) -> bool:
     """Mark a learning as applied"""
+    import yaml
+    try:
+        from yaml import CSafeDumper as YamlDumper
+    except ImportError:
+        from yaml import SafeDumper as YamlDumper
+
     entry = show_learning(learning_id)
     if not entry:
         return False
 
-    # Update metadata
-    text = entry.filepath.read_text()
+    # Update metadata - the entry already holds the raw text and parsed
+    # frontmatter from _load, so skip the second read and reparse
+    text = entry.raw_text
     if text.startswith('---\n'):
         parts = text.split('---\n', 2)
         if len(parts) >= 3:
-            metadata = yaml.safe_load(parts[1])
+            if entry.frontmatter_parsed:
+                metadata = entry.metadata
+            else:
+                # _load only warned and left metadata empty; reparse so
+                # the YAML error surfaces here rather than the rewrite
+                # below destroying the original frontmatter text
+                metadata = yaml.safe_load(parts[1])
             metadata['applied'] = True
-            yaml_str = yaml.dump(metadata, default_flow_style=False, sort_keys=False)
-            entry.filepath.write_text(f"---\n{yaml_str}---\n{parts[2]}")
+            yaml_str = yaml.dump(metadata, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
+            _atomic_write(entry.filepath, f"---\n{yaml_str}---\n{parts[2]}")
             return True
 
     return False
@@ -359,7 +442,7 @@ def update_index():
         })
 
     INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
-    INDEX_FILE.write_text(json.dumps(index, indent=2))
+    _atomic_write(INDEX_FILE, json.dumps(index, indent=2))
 
     # Update tags index
     update_tags_index(entries)
@@ -386,11 +469,22 @@ def update_tags_index(entries: List[LearningEntry]):
                 if other_tag != tag:
                     tags_data[tag]['related'].add(other_tag)
 
-    # Convert sets to lists for JSON serialization
+    # Convert sets to sorted lists - deterministic output is what makes
+    # the no-change guard below able to match a previous run
     for tag in tags_data:
-        tags_data[tag]['related'] = list(tags_data[tag]['related'])
+        tags_data[tag]['related'] = sorted(tags_data[tag]['related'])
+
+    serialized = json.dumps(tags_data, indent=2)
+
+    # Skip the write when nothing changed; rewriting identical bytes
+    # churns the mtime and costs a flush for no reason
+    try:
+        if TAGS_FILE.read_text() == serialized:
+            return
+    except OSError:
+        pass
 
-    TAGS_FILE.write_text(json.dumps(tags_data, indent=2))
+    _atomic_write(TAGS_FILE, serialized)
 
 
 def print_learning_summary(entry: LearningEntry, detailed: bool = False):
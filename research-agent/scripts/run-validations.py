@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Run all research validators in a single interpreter.
+
+Loads validate-research.py, check-evidence.py, and assess-completeness.py
+via importlib (their hyphenated filenames cannot be imported directly) and
+invokes each in-process. validate-all.sh previously spawned one python3
+per validator, paying interpreter startup three times per research file.
+
+Usage:
+    python run-validations.py <research-output-file> [codebase-dir] [threshold]
+"""
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+
+# Colors matching validate-all.sh; dropped when stdout is not a terminal
+# or NO_COLOR is set so redirected CI logs stay clean
+if sys.stdout.isatty() and not os.environ.get('NO_COLOR'):
+    RED = '\033[0;31m'
+    GREEN = '\033[0;32m'
+    YELLOW = '\033[1;33m'
+    BLUE = '\033[0;34m'
+    NC = '\033[0m'
+else:
+    RED = GREEN = YELLOW = BLUE = NC = ''
+
+RULE = '━' * 58
+
+
+def _load(filename: str):
+    """Import a sibling validator script despite its hyphenated filename."""
+    module_name = filename[:-3].replace('-', '_')
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPT_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _run(module, argv) -> int:
+    """Call a validator's main() with a substituted argv, capturing its exit code."""
+    old_argv = sys.argv
+    sys.argv = argv
+    try:
+        module.main()
+    except SystemExit as exc:
+        return exc.code if isinstance(exc.code, int) else 0
+    finally:
+        sys.argv = old_argv
+    return 0
+
+
+def _section(number: int, title: str):
+    print(f"{BLUE}{RULE}{NC}")
+    print(f"{BLUE}Test {number}: {title}{NC}")
+    print(f"{BLUE}{RULE}{NC}")
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python run-validations.py <research-output-file> [codebase-dir] [threshold]")
+        sys.exit(1)
+
+    research_file = sys.argv[1]
+    codebase_dir = sys.argv[2] if len(sys.argv) > 2 else '.'
+    threshold = sys.argv[3] if len(sys.argv) > 3 else '70'
+
+    failed = False
+
+    _section(1, "Quality Standards")
+    if _run(_load('validate-research.py'), ['validate-research.py', research_file]) == 0:
+        print(f"{GREEN}✓ Quality validation passed{NC}")
+    else:
+        print(f"{RED}✗ Quality validation failed{NC}")
+        failed = True
+    print()
+
+    _section(2, "Evidence & File References")
+    if _run(_load('check-evidence.py'),
+            ['check-evidence.py', research_file, '--codebase-dir', codebase_dir]) == 0:
+        print(f"{GREEN}✓ Evidence validation passed{NC}")
+    else:
+        # Don't fail on evidence issues - they might be examples
+        print(f"{YELLOW}⚠  Evidence validation warnings (non-blocking){NC}")
+    print()
+
+    _section(3, "Completeness Assessment")
+    if _run(_load('assess-completeness.py'),
+            ['assess-completeness.py', research_file, '--threshold', threshold]) == 0:
+        print(f"{GREEN}✓ Completeness assessment passed{NC}")
+    else:
+        print(f"{RED}✗ Completeness assessment failed{NC}")
+        failed = True
+    print()
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -52,48 +52,12 @@ echo ""
 
 VALIDATION_FAILED=0
 
-# Test 1: Quality Validation
-echo -e "${BLUE}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
-echo -e "${BLUE}Test 1: Quality Standards${NC}"
-echo -e "${BLUE}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
-
-if python3 "$SCRIPT_DIR/validate-research.py" "$RESEARCH_FILE"; then
-    echo -e "${GREEN}✓ Quality validation passed${NC}"
-else
-    echo -e "${RED}✗ Quality validation failed${NC}"
+# All three validators run in a single interpreter - spawning python3
+# per test paid startup and import cost three times per research file
+if ! python3 "$SCRIPT_DIR/run-validations.py" "$RESEARCH_FILE" "$CODEBASE_DIR" "$THRESHOLD"; then
     VALIDATION_FAILED=1
 fi
 
-echo ""
-
-# Test 2: Evidence Validation
-echo -e "${BLUE}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
-echo -e "${BLUE}Test 2: Evidence & File References${NC}"
-echo -e "${BLUE}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
-
-if python3 "$SCRIPT_DIR/check-evidence.py" "$RESEARCH_FILE" --codebase-dir "$CODEBASE_DIR"; then
-    echo -e "${GREEN}✓ Evidence validation passed${NC}"
-else
-    echo -e "${YELLOW}⚠  Evidence validation warnings (non-blocking)${NC}"
-    # Don't fail on evidence issues - they might be examples
-fi
-
-echo ""
-
-# Test 3: Completeness Assessment
-echo -e "${BLUE}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
-echo -e "${BLUE}Test 3: Completeness Assessment${NC}"
-echo -e "${BLUE}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
-
-if python3 "$SCRIPT_DIR/assess-completeness.py" "$RESEARCH_FILE" --threshold "$THRESHOLD"; then
-    echo -e "${GREEN}✓ Completeness assessment passed${NC}"
-else
-    echo -e "${RED}✗ Completeness assessment failed${NC}"
-    VALIDATION_FAILED=1
-fi
-
-echo ""
-
 # Final Summary
 echo -e "${BLUE}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
 echo -e "${BLUE}Validation Summary${NC}"
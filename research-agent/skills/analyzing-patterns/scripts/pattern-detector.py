@@ -4,8 +4,11 @@ Automated pattern detection in codebase.
 Usage: python pattern-detector.py --directory ./src
 """
 
+import os
 import re
+import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from collections import defaultdict
 from typing import Dict, List
@@ -58,28 +61,52 @@ def detect_patterns(directory: Path, file_extensions: List[str] = None) -> Dict[
         file_extensions = ['.ts', '.js', '.tsx', '.jsx', '.py', '.java', '.go', '.rs']
 
     results = defaultdict(list)
-
-    # Search for pattern signatures
-    for pattern_name, signatures in PATTERN_SIGNATURES.items():
-        found_files = set()
-
-        for ext in file_extensions:
-            for file_path in directory.rglob(f'*{ext}'):
-                try:
-                    content = file_path.read_text()
-
-                    # Check if any signature matches
-                    for signature in signatures:
-                        if re.search(signature, content, re.IGNORECASE):
-                            rel_path = file_path.relative_to(directory)
-                            found_files.add(str(rel_path))
-                            break
-
-                except Exception:
-                    continue
-
-        if found_files:
-            results[pattern_name] = sorted(list(found_files))
+    extensions = tuple(file_extensions)
+
+    # Walk the tree once with os.scandir instead of one rglob per
+    # pattern/extension pair
+    candidates = []
+    stack = [str(directory)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(extensions):
+                    candidates.append(entry.path)
+
+    def scan_file(path: str):
+        try:
+            content = Path(path).read_text()
+        except Exception:
+            return None
+        matched = [
+            pattern_name
+            for pattern_name, signatures in PATTERN_SIGNATURES.items()
+            if any(re.search(sig, content, re.IGNORECASE) for sig in signatures)
+        ]
+        if not matched:
+            return None
+        return str(Path(path).relative_to(directory)), matched
+
+    # Scanning is dominated by file reads, which release the GIL, so a
+    # thread pool overlaps I/O across candidate files
+    found_files = defaultdict(set)
+    max_workers = min(32, (os.cpu_count() or 4) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for result in executor.map(scan_file, candidates):
+            if result is None:
+                continue
+            rel_path, matched = result
+            for pattern_name in matched:
+                found_files[pattern_name].add(rel_path)
+
+    for pattern_name, files in found_files.items():
+        results[pattern_name] = sorted(files)
 
     return results
 
@@ -100,34 +127,39 @@ def main():
         extensions = [ext.strip() if ext.startswith('.') else f'.{ext.strip()}'
                      for ext in args.extensions.split(',')]
 
-    print(f"# Pattern Detection Report")
-    print(f"Project: {directory.name}")
-    print(f"Path: {directory}")
-    print()
+    # Build the report in memory and write it once instead of paying a
+    # buffered print call per line on large result sets
+    out = [
+        f"# Pattern Detection Report",
+        f"Project: {directory.name}",
+        f"Path: {directory}",
+        "",
+    ]
 
     patterns = detect_patterns(directory, extensions)
 
     if patterns:
-        print(f"## Patterns Found: {len(patterns)}")
-        print()
+        out.append(f"## Patterns Found: {len(patterns)}")
+        out.append("")
 
         for pattern_name, files in sorted(patterns.items()):
-            print(f"### {pattern_name}")
-            print(f"**Occurrences**: {len(files)}")
-            print()
-            print("**Files:**")
+            out.append(f"### {pattern_name}")
+            out.append(f"**Occurrences**: {len(files)}")
+            out.append("")
+            out.append("**Files:**")
             for file in files[:10]:  # Show first 10
-                print(f"- `{file}`")
+                out.append(f"- `{file}`")
             if len(files) > 10:
-                print(f"- ... and {len(files) - 10} more")
-            print()
+                out.append(f"- ... and {len(files) - 10} more")
+            out.append("")
     else:
-        print("## No Patterns Detected")
-        print("Common design patterns not found in the codebase.")
-        print()
+        out.append("## No Patterns Detected")
+        out.append("Common design patterns not found in the codebase.")
+        out.append("")
 
-    print("---")
-    print("Generated by research-agent/analyzing-patterns")
+    out.append("---")
+    out.append("Generated by research-agent/analyzing-patterns")
+    sys.stdout.write('\n'.join(out) + '\n')
 
 if __name__ == '__main__':
     main()
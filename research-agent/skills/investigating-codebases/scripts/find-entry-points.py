@@ -7,6 +7,8 @@ Usage: python find-entry-points.py --directory ./src
 import os
 import sys
 import argparse
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict
 
@@ -20,16 +22,39 @@ ENTRY_POINT_PATTERNS = {
     'web': ['index.html', 'App.tsx', 'App.jsx'],
 }
 
+@lru_cache(maxsize=None)
+def _filename_index(directory: str) -> Dict[str, List[str]]:
+    """Map filename -> paths for a directory tree, built with one scandir walk."""
+    index = defaultdict(list)
+    stack = [directory]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    index[entry.name].append(entry.path)
+    return {name: sorted(paths) for name, paths in index.items()}
+
 def find_entry_points(directory: Path) -> Dict[str, List[Path]]:
     """Find all potential entry points in the directory."""
+    # One walk builds a filename index; every pattern is then a dict lookup
+    # instead of its own rglob traversal over the same tree
+    index = _filename_index(str(directory))
     found_entries = {}
 
     for project_type, patterns in ENTRY_POINT_PATTERNS.items():
         found = []
         for pattern in patterns:
-            # Search recursively
-            matches = list(directory.rglob(pattern))
-            found.extend(matches)
+            name = pattern.rsplit('/', 1)[-1]
+            for path in index.get(name, []):
+                # Patterns like 'cmd/main.go' must match the parent directory too
+                if pattern == name or path.replace(os.sep, '/').endswith('/' + pattern):
+                    found.append(Path(path))
 
         if found:
             found_entries[project_type] = found
@@ -39,22 +64,14 @@ def find_entry_points(directory: Path) -> Dict[str, List[Path]]:
 def detect_build_scripts(directory: Path) -> List[Path]:
     """Find build and run scripts."""
     build_files = []
-
-    # Check package.json scripts
-    package_json = directory / 'package.json'
-    if package_json.exists():
-        build_files.append(package_json)
-
-    # Check for Makefile
-    makefile = directory / 'Makefile'
-    if makefile.exists():
-        build_files.append(makefile)
-
-    # Check for build scripts
-    for build_script in ['build.sh', 'run.sh', 'start.sh']:
-        script = directory / build_script
-        if script.exists():
-            build_files.append(script)
+    base = str(directory)
+
+    # os.path.isfile avoids a PurePath allocation per candidate; the stat
+    # itself is the same either way
+    for name in ['package.json', 'Makefile', 'build.sh', 'run.sh', 'start.sh']:
+        candidate = os.path.join(base, name)
+        if os.path.isfile(candidate):
+            build_files.append(Path(candidate))
 
     return build_files
 
@@ -5,6 +5,7 @@ These tests verify that the sample codebase contains expected patterns
 that the research-agent should be able to detect.
 """
 
+import json
 import pytest
 import re
 from pathlib import Path
@@ -174,7 +175,6 @@ class TestCodebaseStructure:
         assert package_json.exists()
 
         # Should have valid JSON structure
-        import json
         content = json.loads(package_json.read_text())
         assert 'name' in content
         assert 'dependencies' in content
@@ -118,10 +118,25 @@ def analyze_python_code(code: str, result: CodeAnalysisResult) -> None:
         )
         return
 
-    # Count functions and classes
-    functions = [node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
-    async_functions = [node for node in ast.walk(tree) if isinstance(node, ast.AsyncFunctionDef)]
-    classes = [node for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
+    # One walk collects every node category the checks below need; the
+    # tree was previously traversed five times (three list comprehensions
+    # plus a full walk in each of the security and global checks)
+    functions = []
+    async_functions = []
+    classes = []
+    security_nodes = []
+    import_froms = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef):
+            functions.append(node)
+        elif isinstance(node, ast.AsyncFunctionDef):
+            async_functions.append(node)
+        elif isinstance(node, ast.ClassDef):
+            classes.append(node)
+        elif isinstance(node, (ast.Call, ast.Assign)):
+            security_nodes.append(node)
+        elif isinstance(node, ast.ImportFrom):
+            import_froms.append(node)
 
     result.metrics["total_functions"] += len(functions) + len(async_functions)
     result.metrics["total_classes"] += len(classes)
@@ -131,10 +146,10 @@ def analyze_python_code(code: str, result: CodeAnalysisResult) -> None:
         analyze_function(func, code, result)
 
     # Security checks
-    check_security_issues(tree, code, result)
+    check_security_issues(security_nodes, code, result)
 
     # Check for global code quality issues
-    check_global_issues(tree, code, result)
+    check_global_issues(import_froms, tree, result)
 
 
 def analyze_function(func: ast.FunctionDef | ast.AsyncFunctionDef, code: str, result: CodeAnalysisResult) -> None:
@@ -218,10 +233,14 @@ def count_complexity(node: ast.AST) -> int:
     return complexity
 
 
-def check_security_issues(tree: ast.AST, code: str, result: CodeAnalysisResult) -> None:
-    """Check for common security vulnerabilities in Python code."""
+def check_security_issues(security_nodes: list, code: str, result: CodeAnalysisResult) -> None:
+    """Check for common security vulnerabilities in Python code.
 
-    for node in ast.walk(tree):
+    security_nodes holds the Call and Assign nodes in tree-walk order,
+    collected by analyze_python_code's single traversal.
+    """
+
+    for node in security_nodes:
         # Check for dangerous function calls
         if isinstance(node, ast.Call):
             func_name = get_call_name(node)
@@ -292,20 +311,19 @@ def check_security_issues(tree: ast.AST, code: str, result: CodeAnalysisResult)
                                 )
 
 
-def check_global_issues(tree: ast.AST, code: str, result: CodeAnalysisResult) -> None:
+def check_global_issues(import_froms: list, tree: ast.AST, result: CodeAnalysisResult) -> None:
     """Check for code-wide quality issues."""
 
     # Check for wildcard imports
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ImportFrom):
-            for alias in node.names:
-                if alias.name == "*":
-                    result.add_issue(
-                        MINOR,
-                        "wildcard_import",
-                        f"Wildcard import from {node.module} - imports unknown names into namespace",
-                        ""
-                    )
+    for node in import_froms:
+        for alias in node.names:
+            if alias.name == "*":
+                result.add_issue(
+                    MINOR,
+                    "wildcard_import",
+                    f"Wildcard import from {node.module} - imports unknown names into namespace",
+                    ""
+                )
 
     # Check for global variables (excluding constants)
     module_body = tree.body if hasattr(tree, 'body') else []
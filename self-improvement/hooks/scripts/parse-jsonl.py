@@ -15,6 +15,14 @@ import os
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+# C-accelerated parser when available; transcripts are decoded line by
+# line, so loads speed dominates this script. Both raise a ValueError
+# subclass on malformed input, so the error handling is shared.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 def extract_text_content(content: Any) -> str:
     """Extract text from various content formats."""
@@ -69,8 +77,8 @@ def parse_jsonl_file(filepath: str) -> Dict[str, Any]:
                     continue
 
                 try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError as e:
+                    entry = _json_loads(line)
+                except ValueError:
                     # Skip malformed lines but continue
                     continue
 
@@ -8,30 +8,104 @@ Analyzes description clarity, tool permissions, security, and usability.
 
 import sys
 import re
-import yaml
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, NamedTuple, Tuple
 
 # Orchestrator agents are permitted to have the Task tool for delegation
 # These agents coordinate work across other specialized agents
 ORCHESTRATOR_AGENTS = ['project-coordinator', 'investigator', 'workflow-orchestrator']
 
-def extract_frontmatter(file_path: Path) -> Dict:
-    """Extract YAML frontmatter from markdown file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
+# Quality levels from best to worst - the first threshold at or below
+# the overall score wins
+QUALITY_LEVELS = (
+    (4.5, "Excellent ✅"),
+    (4.0, "Good ✓"),
+    (3.0, "Adequate ⚠"),
+    (2.0, "Poor ⚠⚠"),
+    (0.0, "Critical ❌"),
+)
+
+# Frontmatter block delimiters, compiled once for the per-file parse
+FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+
+# Scoring word lists, hoisted so they are built once rather than on
+# every component scored
+VAGUE_WORDS = ('helps', 'manages', 'handles', 'does', 'works with')
+SKILL_TRIGGER_PHRASES = ('auto-invokes when', 'automatically activated when', 'use when')
+AUTO_INVOKE_PHRASES = ('auto-invokes when', 'automatically activated when')
+VAGUE_TRIGGERS = ('when user needs help', 'when appropriate', 'when necessary')
+DANGEROUS_TOOLS = frozenset({'Bash', 'Write', 'Edit'})
+
+# Values the simple parser must hand to YAML so typing stays correct
+_TYPED_VALUE_RE = re.compile(r'-?\d+(\.\d+)?$')
+_YAML_KEYWORDS = frozenset({'true', 'false', 'null', 'yes', 'no', '~'})
+
+def _parse_simple_frontmatter(text: str):
+    """Parse plain key: value frontmatter lines without invoking PyYAML.
+
+    Returns None when the text needs a real YAML parser (nesting, lists,
+    block scalars, comments, or typed values) - callers fall back then.
+    """
+    result = {}
+    for line in text.split('\n'):
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        if line[0] in ' \t' or stripped.startswith('- '):
+            return None
+        key, sep, value = stripped.partition(':')
+        key = key.strip()
+        value = value.strip()
+        if not sep or not key or not value:
+            return None
+        if value[0] in '[{|>&*' or ' #' in value:
+            return None
+        # YAML rejects a second ': ' on a plain scalar line ("mapping
+        # values are not allowed here"); bail out so the fallback parser
+        # reports it. Bare colons (http://x) stay on the fast path.
+        if ': ' in value:
+            return None
+        if value[0] in '\'"':
+            if len(value) < 2 or value[-1] != value[0]:
+                return None
+            value = value[1:-1]
+        elif value.lower() in _YAML_KEYWORDS or _TYPED_VALUE_RE.match(value):
+            return None
+        result[key] = value
+    return result
+
+def parse_frontmatter(content: str) -> Dict:
+    """Parse YAML frontmatter out of already-read markdown content."""
     # Extract frontmatter between --- markers
-    match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
+    match = FRONTMATTER_RE.match(content)
     if not match:
         return {}
 
+    # Fast path: most frontmatter is flat key: value pairs, which a simple
+    # line split handles without paying for the full YAML parser
+    parsed = _parse_simple_frontmatter(match.group(1))
+    if parsed is not None:
+        return parsed
+
+    # Deferred: yaml costs tens of milliseconds to import and the fast
+    # path above handles most components without ever needing it
+    import yaml
+    try:
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader
+
     try:
-        return yaml.safe_load(match.group(1))
+        return yaml.load(match.group(1), Loader=YamlLoader)
     except yaml.YAMLError as e:
         print(f"Error parsing YAML: {e}", file=sys.stderr)
         return {}
 
+def extract_frontmatter(file_path: Path) -> Dict:
+    """Extract YAML frontmatter from markdown file."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return parse_frontmatter(f.read())
+
 def score_description_clarity(frontmatter: Dict, content: str, component_type: str) -> Tuple[int, List[str]]:
     """Score description clarity (1-5)."""
     score = 5
@@ -48,15 +122,13 @@ def score_description_clarity(frontmatter: Dict, content: str, component_type: s
         issues.append("Description could be more detailed (< 100 chars)")
 
     # Check for vague words
-    vague_words = ['helps', 'manages', 'handles', 'does', 'works with']
-    if any(word in description.lower() for word in vague_words):
+    if any(word in description.lower() for word in VAGUE_WORDS):
         score -= 1
         issues.append("Description contains vague words (helps, manages, etc.)")
 
     # For skills, check for auto-invoke triggers
     if component_type == 'skill':
-        trigger_phrases = ['auto-invokes when', 'automatically activated when', 'use when']
-        if not any(phrase in description.lower() for phrase in trigger_phrases):
+        if not any(phrase in description.lower() for phrase in SKILL_TRIGGER_PHRASES):
             score -= 1
             issues.append("Skill description missing auto-invoke trigger specification")
 
@@ -67,23 +139,21 @@ def score_description_clarity(frontmatter: Dict, content: str, component_type: s
 
     return max(1, score), issues
 
-def score_tool_permissions(frontmatter: Dict, component_type: str) -> Tuple[int, List[str]]:
-    """Score tool permissions (1-5)."""
-    score = 5
-    issues = []
-
+def _normalize_tools(frontmatter: Dict) -> List[str]:
+    """Extract the tool list from frontmatter, normalizing the string form."""
     allowed_tools = frontmatter.get('allowed-tools', frontmatter.get('tools', []))
-
-    # Convert to list if string
     if isinstance(allowed_tools, str):
         allowed_tools = [t.strip() for t in allowed_tools.split(',')]
+    return allowed_tools
 
-    if not allowed_tools:
-        return 5, []  # No tools specified (acceptable for some components)
+def score_tool_permissions(frontmatter: Dict, component_type: str,
+                           allowed_tools: List[str]) -> Tuple[int, List[str]]:
+    """Score tool permissions (1-5). Callers skip this when no tools are set."""
+    score = 5
+    issues = []
 
     # Count dangerous tools
-    dangerous_tools = ['Bash', 'Write', 'Edit']
-    has_dangerous = [t for t in allowed_tools if t in dangerous_tools]
+    has_dangerous = [t for t in allowed_tools if t in DANGEROUS_TOOLS]
 
     if has_dangerous:
         score -= 1
@@ -118,8 +188,7 @@ def score_auto_invoke_triggers(frontmatter: Dict, content: str) -> Tuple[int, Li
     description = frontmatter.get('description', '')
 
     # Check if triggers are specified
-    trigger_phrases = ['auto-invokes when', 'automatically activated when']
-    has_triggers = any(phrase in description.lower() for phrase in trigger_phrases)
+    has_triggers = any(phrase in description.lower() for phrase in AUTO_INVOKE_PHRASES)
 
     if not has_triggers:
         score -= 2
@@ -132,22 +201,49 @@ def score_auto_invoke_triggers(frontmatter: Dict, content: str) -> Tuple[int, Li
         issues.append("No specific trigger phrases quoted (e.g., 'how does X work?')")
 
     # Check for vague triggers
-    vague_triggers = ['when user needs help', 'when appropriate', 'when necessary']
-    if any(vague in description.lower() for vague in vague_triggers):
+    if any(vague in description.lower() for vague in VAGUE_TRIGGERS):
         score -= 2
         issues.append("Triggers are too vague")
 
     return max(1, score), issues
 
-def score_security(frontmatter: Dict, content: str) -> Tuple[int, List[str]]:
+class ContentFeatures(NamedTuple):
+    """Immutable facts about a component body, computed in one pass."""
+    doc_line_count: int
+    has_code_fence: bool
+    mentions_validation: bool
+    mentions_security: bool
+    has_usage_section: bool
+    has_capabilities_section: bool
+
+def _extract_content_features(content: str) -> ContentFeatures:
+    """Single pass over the component body shared by the score_* functions.
+
+    The individual scorers each re-scanned (and re-lowercased) the full
+    content; computing the shared facts once keeps them O(1) per check.
+    """
+    lower = content.lower()
+    doc_line_count = 0
+    for line in content.split('\n'):
+        stripped = line.strip()
+        if stripped and not stripped.startswith('#'):
+            doc_line_count += 1
+
+    return ContentFeatures(
+        doc_line_count=doc_line_count,
+        has_code_fence='```' in content,
+        mentions_validation='validate' in lower or 'sanitize' in lower,
+        mentions_security='security' in lower,
+        has_usage_section='## usage' in lower or '## example' in lower,
+        has_capabilities_section='## capabilities' in lower or '## features' in lower,
+    )
+
+def score_security(frontmatter: Dict, features: ContentFeatures,
+                   allowed_tools: List[str]) -> Tuple[int, List[str]]:
     """Score security considerations (1-5)."""
     score = 5
     issues = []
 
-    allowed_tools = frontmatter.get('allowed-tools', frontmatter.get('tools', []))
-    if isinstance(allowed_tools, str):
-        allowed_tools = [t.strip() for t in allowed_tools.split(',')]
-
     # High risk: Bash with Write/Edit
     if 'Bash' in allowed_tools and ('Write' in allowed_tools or 'Edit' in allowed_tools):
         score -= 2
@@ -160,40 +256,37 @@ def score_security(frontmatter: Dict, content: str) -> Tuple[int, List[str]]:
 
     # Check for input validation mentions in content
     if 'Bash' in allowed_tools:
-        if 'validate' not in content.lower() and 'sanitize' not in content.lower():
+        if not features.mentions_validation:
             score -= 1
             issues.append("Bash tool used but no mention of input validation")
 
     # Check for security best practices mention
-    if 'security' in content.lower() or 'validate' in content.lower():
+    if features.mentions_security or features.mentions_validation:
         issues.append("✓ Security considerations mentioned")
 
     return max(1, score), issues
 
-def score_usability(frontmatter: Dict, content: str) -> Tuple[int, List[str]]:
+def score_usability(frontmatter: Dict, features: ContentFeatures) -> Tuple[int, List[str]]:
     """Score usability and developer experience (1-5)."""
     score = 5
     issues = []
 
     # Check for examples in content
-    if '```' not in content:
+    if not features.has_code_fence:
         score -= 1
         issues.append("No code examples in documentation")
 
     # Check for usage section
-    if '## usage' not in content.lower() and '## example' not in content.lower():
+    if not features.has_usage_section:
         score -= 1
         issues.append("No usage or examples section")
 
     # Check for explanation of capabilities
-    if '## capabilities' not in content.lower() and '## features' not in content.lower():
+    if not features.has_capabilities_section:
         issues.append("Consider adding capabilities/features section")
 
     # Check content length (documentation quality)
-    lines = content.split('\n')
-    doc_lines = [l for l in lines if l.strip() and not l.strip().startswith('#')]
-
-    if len(doc_lines) < 20:
+    if features.doc_line_count < 20:
         score -= 1
         issues.append("Sparse documentation (< 20 lines of content)")
 
@@ -223,16 +316,25 @@ def analyze_component(file_path: Path) -> Dict:
         print("Hook analysis not yet implemented", file=sys.stderr)
         return {}
 
-    frontmatter = extract_frontmatter(file_path)
-
+    # Read the file once; frontmatter is parsed from the same content
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
+    frontmatter = parse_frontmatter(content)
+    features = _extract_content_features(content)
+
+    # Normalize the tool list once; both tool and security scoring read it
+    allowed_tools = _normalize_tools(frontmatter)
+
     # Score each dimension
     desc_score, desc_issues = score_description_clarity(frontmatter, content, component_type)
-    tool_score, tool_issues = score_tool_permissions(frontmatter, component_type)
-    security_score, security_issues = score_security(frontmatter, content)
-    usability_score, usability_issues = score_usability(frontmatter, content)
+    if allowed_tools:
+        tool_score, tool_issues = score_tool_permissions(frontmatter, component_type, allowed_tools)
+    else:
+        # No tools specified (acceptable for some components)
+        tool_score, tool_issues = 5, []
+    security_score, security_issues = score_security(frontmatter, features, allowed_tools)
+    usability_score, usability_issues = score_usability(frontmatter, features)
 
     # Auto-invoke only for skills
     if component_type == 'skill':
@@ -278,18 +380,10 @@ def format_report(analysis: Dict) -> str:
     report.append(f"Overall Quality: {analysis['overall_score']:.1f}/5.0")
     report.append("")
 
-    # Determine quality level
+    # Determine quality level from the threshold table
     score = analysis['overall_score']
-    if score >= 4.5:
-        quality_level = "Excellent ✅"
-    elif score >= 4.0:
-        quality_level = "Good ✓"
-    elif score >= 3.0:
-        quality_level = "Adequate ⚠"
-    elif score >= 2.0:
-        quality_level = "Poor ⚠⚠"
-    else:
-        quality_level = "Critical ❌"
+    quality_level = next(label for threshold, label in QUALITY_LEVELS
+                         if score >= threshold)
 
     report.append(f"Quality Level: {quality_level}")
     report.append("")
@@ -332,12 +426,48 @@ def format_report(analysis: Dict) -> str:
 
     return '\n'.join(report)
 
+def _analyze_one(path_str: str) -> Tuple[str, float, str]:
+    """Analyze one component for batch mode; never raises."""
+    try:
+        analysis = analyze_component(Path(path_str))
+        return path_str, analysis['overall_score'], format_report(analysis)
+    except Exception as e:
+        return path_str, None, f"Error analyzing component: {path_str}: {e}"
+
+def _run_batch(paths: List[str]) -> None:
+    """Score many components in parallel and report in argument order."""
+    if not paths:
+        print("Usage: python quality-scorer.py --batch <file> [<file> ...]", file=sys.stderr)
+        sys.exit(1)
+
+    # Scoring is CPU-bound and independent per file, so a process pool
+    # gives near-linear speedup for CI-style bulk runs
+    from concurrent.futures import ProcessPoolExecutor
+
+    exit_code = 0
+    with ProcessPoolExecutor() as executor:
+        for path_str, score, report in executor.map(_analyze_one, paths):
+            print(report)
+            if score is None:
+                exit_code = max(exit_code, 3)
+            elif score < 3.0:
+                exit_code = max(exit_code, 2)
+            elif score < 4.0:
+                exit_code = max(exit_code, 1)
+
+    sys.exit(exit_code)
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python quality-scorer.py <component-file>", file=sys.stderr)
         print("  component-file: Path to agent, skill, or command markdown file", file=sys.stderr)
+        print("  or: python quality-scorer.py --batch <file> [<file> ...]", file=sys.stderr)
         sys.exit(1)
 
+    if sys.argv[1] == '--batch':
+        _run_batch(sys.argv[2:])
+        return
+
     file_path = Path(sys.argv[1])
 
     if not file_path.exists():
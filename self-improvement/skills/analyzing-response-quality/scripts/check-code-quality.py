@@ -21,6 +21,33 @@ import re
 import sys
 from typing import Any
 
+# Compiled once at import - every pattern below runs against each code
+# block, so per-call re.findall would re-resolve them through re's cache
+# for every block analyzed
+JS_FUNCTION_RE = re.compile(r'\bfunction\s+\w+\s*\(|const\s+\w+\s*=\s*(?:async\s*)?\([^)]*\)\s*=>')
+JS_VAR_RE = re.compile(r'\bvar\s+')
+JS_LOOSE_EQ_RE = re.compile(r'[^=!]==[^=]')
+JS_CONSOLE_RE = re.compile(r'console\.(log|warn|error)\s*\(')
+JS_EMPTY_CATCH_RE = re.compile(r'catch\s*\([^)]*\)\s*\{\s*\}')
+CODE_BLOCK_RE = re.compile(r"```(\w*)\n(.*?)```", re.DOTALL)
+CODE_HINT_RE = re.compile(r'(def |class |function |const |import |from )')
+
+
+def _own_nodes(func):
+    """Yield nodes of a function without descending into nested functions.
+
+    ast.walk(func) visits nested function bodies too, so a handler inside
+    an inner function would be reported (and penalized) once for every
+    enclosing function as well as for the inner function itself.
+    """
+    stack = list(ast.iter_child_nodes(func))
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        yield node
+        stack.extend(ast.iter_child_nodes(node))
+
 
 def check_python_quality(code: str) -> dict:
     """Check Python code quality and return scores."""
@@ -81,8 +108,9 @@ def check_python_quality(code: str) -> dict:
             })
             result["score"] -= 5
 
-        # Check for bare except
-        for node in ast.walk(func):
+        # Check for bare except (own body only, nested functions are
+        # visited in their own loop iteration)
+        for node in _own_nodes(func):
             if isinstance(node, ast.ExceptHandler) and node.type is None:
                 result["issues"].append({
                     "severity": "important",
@@ -113,13 +141,13 @@ def check_javascript_quality(code: str) -> dict:
         "score": 100,
         "issues": [],
         "metrics": {
-            "functions": len(re.findall(r'\bfunction\s+\w+\s*\(|const\s+\w+\s*=\s*(?:async\s*)?\([^)]*\)\s*=>', code)),
+            "functions": len(JS_FUNCTION_RE.findall(code)),
             "lines": code.count('\n') + 1
         }
     }
 
     # Check for var usage
-    var_count = len(re.findall(r'\bvar\s+', code))
+    var_count = len(JS_VAR_RE.findall(code))
     if var_count > 0:
         result["issues"].append({
             "severity": "minor",
@@ -128,7 +156,7 @@ def check_javascript_quality(code: str) -> dict:
         result["score"] -= var_count * 2
 
     # Check for == vs ===
-    loose_eq = len(re.findall(r'[^=!]==[^=]', code))
+    loose_eq = len(JS_LOOSE_EQ_RE.findall(code))
     if loose_eq > 0:
         result["issues"].append({
             "severity": "minor",
@@ -137,7 +165,7 @@ def check_javascript_quality(code: str) -> dict:
         result["score"] -= loose_eq
 
     # Check for console.log
-    console_count = len(re.findall(r'console\.(log|warn|error)\s*\(', code))
+    console_count = len(JS_CONSOLE_RE.findall(code))
     if console_count > 3:
         result["issues"].append({
             "severity": "minor",
@@ -146,7 +174,7 @@ def check_javascript_quality(code: str) -> dict:
         result["score"] -= 2
 
     # Check for empty catch blocks
-    empty_catch = len(re.findall(r'catch\s*\([^)]*\)\s*\{\s*\}', code))
+    empty_catch = len(JS_EMPTY_CATCH_RE.findall(code))
     if empty_catch > 0:
         result["issues"].append({
             "severity": "important",
@@ -160,8 +188,7 @@ def check_javascript_quality(code: str) -> dict:
 
 def extract_code_blocks(text: str) -> list[tuple[str, str]]:
     """Extract code blocks with their language."""
-    pattern = r"```(\w*)\n(.*?)```"
-    matches = re.findall(pattern, text, re.DOTALL)
+    matches = CODE_BLOCK_RE.findall(text)
     return [(lang.lower() if lang else "unknown", code.strip()) for lang, code in matches]
 
 
@@ -171,7 +198,7 @@ def check_quality(text: str) -> dict:
 
     if not blocks:
         # Check if the text itself is code
-        if re.search(r'(def |class |function |const |import |from )', text):
+        if CODE_HINT_RE.search(text):
             blocks = [("unknown", text)]
         else:
             return {
@@ -19,6 +19,28 @@ import json
 import re
 import sys
 
+# Patterns compiled once at module load - analyze_completeness runs them all
+# per response, and batch callers invoke it once per file
+CODE_BLOCK_RE = re.compile(r"```\w*\n(.*?)```", re.DOTALL)
+TRY_CATCH_RE = re.compile(r'\b(try|catch|except|finally)\b')
+ERROR_CHECK_RE = re.compile(r'\b(if\s+err|error\s*!=|\.catch\(|on_?error)\b')
+VALIDATION_RE = re.compile(
+    r'\b(validat|sanitiz|check|verify|assert|if\s+not?\s+|if\s+\w+\s*[!=]=|typeof|instanceof)\b',
+    re.IGNORECASE
+)
+EDGE_CASE_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'\b(empty|null|none|undefined|zero|negative)\b',
+    r'\b(edge\s*case|corner\s*case|boundary)\b',
+    r'\bif\s+len\s*\([^)]+\)\s*[=<>]',
+    r'\bif\s+not\s+\w+\b'
+)]
+COMMENT_RE = re.compile(r'(#|//|/\*|\"\"\"|\'\'\')')
+DOCSTRING_RE = re.compile(r'(\"\"\"|\'\'\')[^"\']+\1')
+TESTS_RE = re.compile(r'\b(test_|_test|Test|spec\.|describe\(|it\(|expect\(|assert)')
+EXAMPLES_RE = re.compile(r'(example|usage|output|result)[:\s]', re.IGNORECASE)
+CODE_BLOCK_STRIP_RE = re.compile(r'```.*?```', re.DOTALL)
+WORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+
 
 def analyze_completeness(response: str, requirements: str = "") -> dict:
     """Analyze the completeness of a response."""
@@ -29,17 +51,17 @@ def analyze_completeness(response: str, requirements: str = "") -> dict:
         "suggestions": []
     }
 
-    # Check for code blocks
-    code_blocks = len(re.findall(r"```", response)) // 2
+    # Extract code blocks once; the count falls out of the same scan, and
+    # counting actual blocks (not fence pairs) handles unclosed fences
+    code_block_matches = CODE_BLOCK_RE.findall(response)
+    code_blocks = len(code_block_matches)
     has_code = code_blocks > 0
-
-    # Extract code for analysis
-    code_content = "\n".join(re.findall(r"```\w*\n(.*?)```", response, re.DOTALL))
+    code_content = "\n".join(code_block_matches)
 
     # Check 1: Error Handling
     if has_code:
-        has_try_catch = bool(re.search(r'\b(try|catch|except|finally)\b', code_content))
-        has_error_check = bool(re.search(r'\b(if\s+err|error\s*!=|\.catch\(|on_?error)\b', code_content))
+        has_try_catch = bool(TRY_CATCH_RE.search(code_content))
+        has_error_check = bool(ERROR_CHECK_RE.search(code_content))
 
         if has_try_catch or has_error_check:
             result["checks"].append({
@@ -59,10 +81,7 @@ def analyze_completeness(response: str, requirements: str = "") -> dict:
 
     # Check 2: Input Validation
     if has_code:
-        has_validation = bool(re.search(
-            r'\b(validat|sanitiz|check|verify|assert|if\s+not?\s+|if\s+\w+\s*[!=]=|typeof|instanceof)\b',
-            code_content, re.IGNORECASE
-        ))
+        has_validation = bool(VALIDATION_RE.search(code_content))
 
         if has_validation:
             result["checks"].append({
@@ -81,14 +100,7 @@ def analyze_completeness(response: str, requirements: str = "") -> dict:
             result["score"] -= 10
 
     # Check 3: Edge Cases
-    edge_case_indicators = [
-        r'\b(empty|null|none|undefined|zero|negative)\b',
-        r'\b(edge\s*case|corner\s*case|boundary)\b',
-        r'\bif\s+len\s*\([^)]+\)\s*[=<>]',
-        r'\bif\s+not\s+\w+\b'
-    ]
-
-    edge_cases_mentioned = sum(1 for pattern in edge_case_indicators if re.search(pattern, response, re.IGNORECASE))
+    edge_cases_mentioned = sum(1 for pattern in EDGE_CASE_RES if pattern.search(response))
 
     if edge_cases_mentioned >= 2:
         result["checks"].append({
@@ -108,8 +120,8 @@ def analyze_completeness(response: str, requirements: str = "") -> dict:
 
     # Check 4: Documentation/Explanation
     has_explanation = len(response) - len(code_content) > 100 if has_code else True
-    has_comments = bool(re.search(r'(#|//|/\*|\"\"\"|\'\'\')', code_content))
-    has_docstring = bool(re.search(r'(\"\"\"|\'\'\')[^"\']+\1', code_content))
+    has_comments = bool(COMMENT_RE.search(code_content))
+    has_docstring = bool(DOCSTRING_RE.search(code_content))
 
     if has_explanation or has_comments or has_docstring:
         result["checks"].append({
@@ -128,8 +140,8 @@ def analyze_completeness(response: str, requirements: str = "") -> dict:
         result["score"] -= 5
 
     # Check 5: Tests or Usage Examples
-    has_tests = bool(re.search(r'\b(test_|_test|Test|spec\.|describe\(|it\(|expect\(|assert)', response))
-    has_examples = bool(re.search(r'(example|usage|output|result)[:\s]', response, re.IGNORECASE))
+    has_tests = bool(TESTS_RE.search(response))
+    has_examples = bool(EXAMPLES_RE.search(response))
 
     if has_tests or has_examples:
         result["checks"].append({
@@ -187,10 +199,10 @@ def analyze_completeness(response: str, requirements: str = "") -> dict:
 def extract_keywords(text: str) -> set:
     """Extract significant keywords from text."""
     # Remove code blocks
-    text = re.sub(r'```.*?```', '', text, flags=re.DOTALL)
+    text = CODE_BLOCK_STRIP_RE.sub('', text)
 
     # Extract words
-    words = re.findall(r'\b[a-zA-Z]{4,}\b', text.lower())
+    words = WORD_RE.findall(text.lower())
 
     # Filter common words
     stopwords = {
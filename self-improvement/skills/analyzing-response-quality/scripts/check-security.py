@@ -16,50 +16,97 @@ Returns JSON with security scores and vulnerabilities found.
 """
 
 import ast
+import bisect
 import json
 import re
 import sys
 from typing import Any
 
 
-# Vulnerability patterns by severity
+# Vulnerability patterns by severity. The last element is a cheap
+# lowercase literal screened with `in` before the regex runs - most
+# inputs contain none of these, so the engine is rarely invoked.
 CRITICAL_PATTERNS = [
-    (r'\beval\s*\(', "eval()", "Code execution vulnerability - eval can run arbitrary code"),
-    (r'\bexec\s*\(', "exec()", "Code execution vulnerability - exec can run arbitrary code"),
-    (r'pickle\.(loads?|dump)', "pickle", "Insecure deserialization - pickle can execute arbitrary code"),
-    (r'yaml\.load\s*\([^)]*\)', "yaml.load", "Use yaml.safe_load() instead of yaml.load()"),
-    (r'subprocess.*shell\s*=\s*True', "shell=True", "Command injection risk - avoid shell=True"),
-    (r'\bos\.system\s*\(', "os.system()", "Command injection risk - use subprocess with shell=False"),
-    (r'\.innerHTML\s*=', "innerHTML", "XSS vulnerability - sanitize HTML or use textContent"),
-    (r'document\.write\s*\(', "document.write()", "XSS vulnerability - avoid document.write"),
-    (r"rm\s+-rf?\s+[\"']?\$", "rm -rf $var", "Dangerous file deletion with variable"),
-    (r'curl.*\|\s*(?:ba)?sh', "curl | bash", "Remote code execution - never pipe curl to shell"),
+    (r'\beval\s*\(', "eval()", "Code execution vulnerability - eval can run arbitrary code", 'eval'),
+    (r'\bexec\s*\(', "exec()", "Code execution vulnerability - exec can run arbitrary code", 'exec'),
+    (r'pickle\.(loads?|dump)', "pickle", "Insecure deserialization - pickle can execute arbitrary code", 'pickle.'),
+    (r'yaml\.load\s*\([^)]*\)', "yaml.load", "Use yaml.safe_load() instead of yaml.load()", 'yaml.load'),
+    (r'subprocess.*shell\s*=\s*True', "shell=True", "Command injection risk - avoid shell=True", 'shell'),
+    (r'\bos\.system\s*\(', "os.system()", "Command injection risk - use subprocess with shell=False", 'os.system'),
+    (r'\.innerHTML\s*=', "innerHTML", "XSS vulnerability - sanitize HTML or use textContent", 'innerhtml'),
+    (r'document\.write\s*\(', "document.write()", "XSS vulnerability - avoid document.write", 'document.write'),
+    (r"rm\s+-rf?\s+[\"']?\$", "rm -rf $var", "Dangerous file deletion with variable", 'rm '),
+    (r'curl.*\|\s*(?:ba)?sh', "curl | bash", "Remote code execution - never pipe curl to shell", 'curl'),
 ]
 
+# The hardcoded-secret patterns differ only in the keyword, so one
+# alternation scans the code once instead of once per secret type
+SECRET_ASSIGNMENT_RE = re.compile(
+    r'(password|api_?key|secret|token)\s*=\s*["\'][^"\']+["\']',
+    re.IGNORECASE | re.MULTILINE,
+)
+
+SECRET_REPORTS = {
+    "password": ("Hardcoded password", "Store passwords in environment variables or vaults"),
+    "apikey": ("Hardcoded API key", "Store API keys in environment variables"),
+    "secret": ("Hardcoded secret", "Store secrets securely, not in code"),
+    "token": ("Hardcoded token", "Store tokens in environment variables"),
+}
+
 IMPORTANT_PATTERNS = [
-    (r'password\s*=\s*["\'][^"\']+["\']', "Hardcoded password", "Store passwords in environment variables or vaults"),
-    (r'api_?key\s*=\s*["\'][^"\']+["\']', "Hardcoded API key", "Store API keys in environment variables"),
-    (r'secret\s*=\s*["\'][^"\']+["\']', "Hardcoded secret", "Store secrets securely, not in code"),
-    (r'token\s*=\s*["\'][^"\']+["\']', "Hardcoded token", "Store tokens in environment variables"),
-    (r'["\']-----BEGIN (?:RSA |DSA )?PRIVATE KEY-----', "Private key in code", "Never commit private keys"),
-    (r'(?:mysql|postgres|mongodb)://[^:]+:[^@]+@', "Database URL with password", "Use environment variables for credentials"),
-    (r'SELECT.*FROM.*WHERE.*["\'].*\+', "SQL string concatenation", "Use parameterized queries"),
-    (r'f["\'].*SELECT.*\{', "SQL f-string", "Use parameterized queries, not f-strings"),
-    (r'query\s*\+\s*["\']', "SQL concatenation", "Use parameterized queries"),
-    (r'\$_(?:GET|POST|REQUEST)\[', "Unsanitized PHP input", "Sanitize and validate all user input"),
-    (r'dangerouslySetInnerHTML', "dangerouslySetInnerHTML", "XSS risk - sanitize content first"),
+    (r'["\']-----BEGIN (?:RSA |DSA )?PRIVATE KEY-----', "Private key in code", "Never commit private keys", '-----begin'),
+    (r'(?:mysql|postgres|mongodb)://[^:]+:[^@]+@', "Database URL with password", "Use environment variables for credentials", '://'),
+    (r'SELECT.*FROM.*WHERE.*["\'].*\+', "SQL string concatenation", "Use parameterized queries", 'select'),
+    (r'f["\'].*SELECT.*\{', "SQL f-string", "Use parameterized queries, not f-strings", 'select'),
+    (r'query\s*\+\s*["\']', "SQL concatenation", "Use parameterized queries", 'query'),
+    (r'\$_(?:GET|POST|REQUEST)\[', "Unsanitized PHP input", "Sanitize and validate all user input", '$_'),
+    (r'dangerouslySetInnerHTML', "dangerouslySetInnerHTML", "XSS risk - sanitize content first", 'dangerouslysetinnerhtml'),
 ]
 
 MINOR_PATTERNS = [
-    (r'\bMD5\s*\(|hashlib\.md5', "MD5 hash", "MD5 is weak - use SHA-256 or bcrypt for passwords"),
-    (r'\bSHA1\s*\(|hashlib\.sha1', "SHA1 hash", "SHA1 is weak - use SHA-256 or better"),
-    (r'verify\s*=\s*False', "SSL verification disabled", "Don't disable SSL certificate verification"),
-    (r'random\.(random|randint|choice)\s*\(', "Weak random", "Use secrets module for security-sensitive randomness"),
-    (r'Math\.random\s*\(', "Math.random()", "Use crypto.getRandomValues() for security"),
-    (r'chmod\s+777', "chmod 777", "Overly permissive - use minimal required permissions"),
-    (r'console\.(log|warn)\s*\(.*(password|secret|key|token)', "Logging sensitive data", "Don't log secrets"),
+    (r'\bMD5\s*\(|hashlib\.md5', "MD5 hash", "MD5 is weak - use SHA-256 or bcrypt for passwords", 'md5'),
+    (r'\bSHA1\s*\(|hashlib\.sha1', "SHA1 hash", "SHA1 is weak - use SHA-256 or better", 'sha1'),
+    (r'verify\s*=\s*False', "SSL verification disabled", "Don't disable SSL certificate verification", 'verify'),
+    (r'random\.(random|randint|choice)\s*\(', "Weak random", "Use secrets module for security-sensitive randomness", 'random.'),
+    (r'Math\.random\s*\(', "Math.random()", "Use crypto.getRandomValues() for security", 'math.random'),
+    (r'chmod\s+777', "chmod 777", "Overly permissive - use minimal required permissions", 'chmod'),
+    (r'console\.(log|warn)\s*\(.*(password|secret|key|token)', "Logging sensitive data", "Don't log secrets", 'console.'),
 ]
 
+# Compile every pattern once at import; check_patterns runs all three
+# lists per input, and calling re.finditer with a raw string would
+# re-resolve each pattern through re's cache on every call
+_PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+CRITICAL_PATTERNS = [(re.compile(p, _PATTERN_FLAGS), n, m, s) for p, n, m, s in CRITICAL_PATTERNS]
+IMPORTANT_PATTERNS = [(re.compile(p, _PATTERN_FLAGS), n, m, s) for p, n, m, s in IMPORTANT_PATTERNS]
+MINOR_PATTERNS = [(re.compile(p, _PATTERN_FLAGS), n, m, s) for p, n, m, s in MINOR_PATTERNS]
+
+# All screen literals fused into one alternation (longest first, so the
+# longer literal wins at a shared position) - one scan over the lowered
+# text replaces a separate substring search per pattern. The secret
+# keywords join the alternation so their any() check shares the pass.
+SECRET_SCREENS = ('password', 'key', 'secret', 'token')
+_ALL_SCREENS = sorted(
+    {s for _, _, _, s in CRITICAL_PATTERNS + IMPORTANT_PATTERNS + MINOR_PATTERNS}
+    | set(SECRET_SCREENS),
+    key=len, reverse=True)
+SCREEN_RE = re.compile('|'.join(re.escape(s) for s in _ALL_SCREENS))
+
+
+def _present_screens(lowered: str) -> set:
+    """Collect which screen literals occur in the text with one scan.
+
+    Resumes from start+1 after each hit rather than the match end, so a
+    screen nested inside a longer one (innerhtml within
+    dangerouslysetinnerhtml) is still detected.
+    """
+    present = set()
+    pos = 0
+    while (match := SCREEN_RE.search(lowered, pos)) is not None:
+        present.add(match.group())
+        pos = match.start() + 1
+    return present
+
 
 def check_python_security(code: str) -> list[dict]:
     """Check Python code for security issues using AST."""
@@ -137,14 +184,31 @@ def get_call_name(node: ast.Call) -> str:
     return ""
 
 
+def _line_start_index(code: str) -> list[int]:
+    """Offsets where each line begins, for offset -> line number lookups.
+
+    Computing this once keeps line numbering O(log n) per match instead of
+    counting newlines from the start of the code for every match.
+    """
+    starts = [0]
+    pos = code.find('\n')
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = code.find('\n', pos + 1)
+    return starts
+
+
 def check_patterns(code: str) -> list[dict]:
     """Check code against vulnerability patterns."""
     issues = []
-
-    for pattern, name, message in CRITICAL_PATTERNS:
-        matches = list(re.finditer(pattern, code, re.IGNORECASE | re.MULTILINE))
-        for match in matches:
-            line_num = code[:match.start()].count('\n') + 1
+    line_starts = _line_start_index(code)
+    screens = _present_screens(code.lower())
+
+    for pattern, name, message, screen in CRITICAL_PATTERNS:
+        if screen not in screens:
+            continue
+        for match in pattern.finditer(code):
+            line_num = bisect.bisect_right(line_starts, match.start())
             issues.append({
                 "severity": "critical",
                 "type": name.lower().replace(' ', '_').replace('()', ''),
@@ -153,10 +217,26 @@ def check_patterns(code: str) -> list[dict]:
                 "match": match.group()[:50]
             })
 
-    for pattern, name, message in IMPORTANT_PATTERNS:
-        matches = list(re.finditer(pattern, code, re.IGNORECASE | re.MULTILINE))
-        for match in matches:
-            line_num = code[:match.start()].count('\n') + 1
+    if not screens.isdisjoint(SECRET_SCREENS):
+        secret_matches = SECRET_ASSIGNMENT_RE.finditer(code)
+    else:
+        secret_matches = ()
+    for match in secret_matches:
+        name, message = SECRET_REPORTS[match.group(1).lower().replace('_', '')]
+        line_num = bisect.bisect_right(line_starts, match.start())
+        issues.append({
+            "severity": "important",
+            "type": name.lower().replace(' ', '_'),
+            "message": message,
+            "line": line_num,
+            "match": match.group()[:50]
+        })
+
+    for pattern, name, message, screen in IMPORTANT_PATTERNS:
+        if screen not in screens:
+            continue
+        for match in pattern.finditer(code):
+            line_num = bisect.bisect_right(line_starts, match.start())
             issues.append({
                 "severity": "important",
                 "type": name.lower().replace(' ', '_'),
@@ -165,10 +245,11 @@ def check_patterns(code: str) -> list[dict]:
                 "match": match.group()[:50]
             })
 
-    for pattern, name, message in MINOR_PATTERNS:
-        matches = list(re.finditer(pattern, code, re.IGNORECASE | re.MULTILINE))
-        for match in matches:
-            line_num = code[:match.start()].count('\n') + 1
+    for pattern, name, message, screen in MINOR_PATTERNS:
+        if screen not in screens:
+            continue
+        for match in pattern.finditer(code):
+            line_num = bisect.bisect_right(line_starts, match.start())
             issues.append({
                 "severity": "minor",
                 "type": name.lower().replace(' ', '_').replace('()', ''),
@@ -0,0 +1,90 @@
+"""
+Shared helpers for the agent invocation tests.
+
+Used by both conftest.py (pytest fixtures) and run_tests.py (standalone
+unittest runner). Keeping one copy here avoids drift between the two and
+lets frontmatter parses be cached across helpers - the same agent file is
+hit several times per run (parse check, name lookup, tools lookup).
+"""
+import re
+import yaml
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# libyaml-backed loader when available; same safe schema, much faster
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Agent names are plain scalars in practice, so a line scan answers
+# name-only lookups without a full YAML parse
+NAME_LINE_RE = re.compile(r'^name\s*:\s*(.+?)\s*$', re.MULTILINE)
+
+# Frontmatter block at the top of a component file - compiled once rather
+# than re-resolved through re's cache on every helper call
+FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---', re.DOTALL)
+
+# Parsed frontmatter keyed by (path, mtime_ns) so edits invalidate entries
+_frontmatter_cache: Dict = {}
+
+
+def extract_frontmatter(file_path: Path) -> Dict:
+    """Extract YAML frontmatter from a markdown file."""
+    key = (str(file_path), file_path.stat().st_mtime_ns)
+    cached = _frontmatter_cache.get(key)
+    if cached is not None:
+        return cached
+
+    # Only the frontmatter is needed, so read a bounded prefix and fall back
+    # to the full file only when the closing delimiter is not in the prefix
+    with open(file_path, encoding='utf-8') as f:
+        content = f.read(8192)
+        if '\n---' not in content[3:]:
+            content += f.read()
+    match = FRONTMATTER_RE.match(content)
+    result = {}
+    if match:
+        try:
+            result = yaml.load(match.group(1), Loader=_YamlLoader) or {}
+        except yaml.YAMLError:
+            result = {}
+
+    _frontmatter_cache[key] = result
+    return result
+
+
+def get_agent_tools(file_path: Path) -> List[str]:
+    """Extract the list of tools from an agent file."""
+    # Cheap textual screen before parsing: when the complete frontmatter
+    # block is in the prefix and has no 'tools:' line, there is nothing
+    # for YAML to find
+    key = (str(file_path), file_path.stat().st_mtime_ns)
+    if key not in _frontmatter_cache:
+        with open(file_path, encoding='utf-8') as f:
+            prefix = f.read(8192)
+        match = FRONTMATTER_RE.match(prefix)
+        if match and 'tools:' not in match.group(1):
+            return []
+
+    frontmatter = extract_frontmatter(file_path)
+    tools = frontmatter.get('tools', '')
+
+    if isinstance(tools, str):
+        return [t.strip() for t in tools.split(',') if t.strip()]
+    elif isinstance(tools, list):
+        return tools
+    return []
+
+
+def get_agent_name(file_path: Path) -> Optional[str]:
+    """Extract the agent name from frontmatter."""
+    with open(file_path, encoding='utf-8') as f:
+        prefix = f.read(8192)
+    match = FRONTMATTER_RE.match(prefix)
+    if match:
+        name_match = NAME_LINE_RE.search(match.group(1))
+        if name_match:
+            return name_match.group(1).strip('\'"')
+    # Fall back to the YAML parser when the scan is inconclusive
+    return extract_frontmatter(file_path).get('name')
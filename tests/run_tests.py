@@ -6,9 +6,9 @@ Does not require pytest - uses built-in unittest.
 import sys
 import unittest
 from pathlib import Path
-import yaml
-import re
-from typing import Dict, List, Optional
+from typing import List
+
+from component_utils import extract_frontmatter, get_agent_tools, get_agent_name
 
 # Add the quality-scorer module to path
 REPO_ROOT = Path(__file__).parent.parent
@@ -18,36 +18,6 @@ sys.path.insert(0, str(REPO_ROOT / 'self-improvement' / 'skills' / 'analyzing-co
 ORCHESTRATOR_AGENTS = ['project-coordinator', 'investigator', 'workflow-orchestrator']
 
 
-def extract_frontmatter(file_path: Path) -> Dict:
-    """Extract YAML frontmatter from a markdown file."""
-    content = file_path.read_text(encoding='utf-8')
-    match = re.match(r'^---\s*\n(.*?)\n---', content, re.DOTALL)
-    if match:
-        try:
-            return yaml.safe_load(match.group(1)) or {}
-        except yaml.YAMLError:
-            return {}
-    return {}
-
-
-def get_agent_tools(file_path: Path) -> List[str]:
-    """Extract the list of tools from an agent file."""
-    frontmatter = extract_frontmatter(file_path)
-    tools = frontmatter.get('tools', '')
-
-    if isinstance(tools, str):
-        return [t.strip() for t in tools.split(',') if t.strip()]
-    elif isinstance(tools, list):
-        return tools
-    return []
-
-
-def get_agent_name(file_path: Path) -> Optional[str]:
-    """Extract the agent name from frontmatter."""
-    frontmatter = extract_frontmatter(file_path)
-    return frontmatter.get('name')
-
-
 def get_all_agent_files() -> List[Path]:
     """Find all agent definition files across all plugins."""
     return sorted(REPO_ROOT.glob('*/agents/*.md'))
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+In-process component validation for every plugin in the repository.
+
+validate-plugins.sh previously spawned one python3 process per agent, skill,
+command, and hooks file, so bulk validation paid interpreter startup and
+PyYAML import once per component. This driver imports each validator module
+once and calls its validate function directly.
+"""
+
+import argparse
+import importlib.util
+import json
+import multiprocessing
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent
+SKILLS_DIR = REPO_ROOT / 'claude-component-builder' / 'skills'
+
+# Opt-in incremental cache: set VALIDATION_CACHE=1 to reuse results for
+# components whose (mtime, size) have not changed since the last run
+CACHE_PATH = REPO_ROOT / '.claude' / '.validation-cache.pkl'
+
+# Colors for output (matches validate-plugins.sh); dropped when stdout
+# is not a terminal or NO_COLOR is set so redirected CI logs stay clean
+if sys.stdout.isatty() and not os.environ.get('NO_COLOR'):
+    RED = '\033[0;31m'
+    GREEN = '\033[0;32m'
+    YELLOW = '\033[1;33m'
+    NC = '\033[0m'
+else:
+    RED = GREEN = YELLOW = NC = ''
+
+
+def load_validator(module_name: str, script_path: Path):
+    """Import a hyphen-named validator script as a module."""
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_cache():
+    """Load the incremental result cache, or None when caching is disabled."""
+    if os.environ.get('VALIDATION_CACHE') != '1':
+        return None
+    try:
+        with open(CACHE_PATH, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        return {}
+
+
+def save_cache(cache) -> None:
+    """Write the result cache back to disk (no-op when caching is disabled)."""
+    if cache is None:
+        return
+    try:
+        CACHE_PATH.parent.mkdir(exist_ok=True)
+        with open(CACHE_PATH, 'wb') as f:
+            pickle.dump(cache, f)
+    except OSError:
+        pass
+
+
+def cached_validate(cache, stat_path: Path, target: str, validate) -> list:
+    """Run a validator, reusing the cached error list for unchanged files.
+
+    stat_path is the file whose (mtime, size) keys the cache entry; target is
+    the argument handed to the validator (a file or, for skills, a directory).
+    """
+    if cache is None:
+        return validate(target)[1]
+    st = stat_path.stat()
+    entry = cache.get(target)
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2]
+    errors = validate(target)[1]
+    cache[target] = (st.st_mtime_ns, st.st_size, errors)
+    return errors
+
+
+def has_critical_errors(errors: list) -> bool:
+    """Mirror the validators' exit-code rule: warnings and recommendations pass."""
+    return any(
+        not e.startswith(('Warning:', 'Recommendation:'))
+        for e in errors
+    )
+
+
+def validate_plugin_components(plugin_dir: Path, validators: dict, out: list, cache=None) -> tuple:
+    """Validate one plugin's manifest and components, appending report lines to out.
+
+    Returns:
+        tuple: (error_count, warning_count)
+    """
+    errors = 0
+    warnings = 0
+
+    out.append(f"📦 Validating plugin: {plugin_dir.name}")
+    out.append(f"   Location: {plugin_dir.name}/")
+
+    manifest = plugin_dir / '.claude-plugin' / 'plugin.json'
+    if not manifest.is_file():
+        out.append(f"   {RED}✗{NC} Missing plugin.json manifest")
+        out.append("")
+        return 1, 0
+
+    try:
+        json.loads(manifest.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        out.append(f"   {RED}✗{NC} Invalid JSON in plugin.json")
+        out.append("")
+        return 1, 0
+
+    out.append(f"   {GREEN}✓{NC} plugin.json exists and is valid JSON")
+
+    agents_dir = plugin_dir / 'agents'
+    if agents_dir.is_dir():
+        for agent in sorted(agents_dir.glob('*.md')):
+            agent_errors = cached_validate(cache, agent, str(agent),
+                                           validators['agent'].validate_agent)
+            if has_critical_errors(agent_errors):
+                out.append(f"   {RED}✗{NC} Agent: {agent.name} (validation failed)")
+                out.extend(f"      {e}" for e in agent_errors)
+                errors += 1
+            else:
+                out.append(f"   {GREEN}✓{NC} Agent: {agent.name}")
+
+    hooks_file = plugin_dir / 'hooks' / 'hooks.json'
+    if hooks_file.is_file():
+        hook_errors = cached_validate(cache, hooks_file, str(hooks_file),
+                                      validators['hooks'].validate_hooks)
+        if has_critical_errors(hook_errors):
+            out.append(f"   {RED}✗{NC} hooks.json validation failed")
+            errors += 1
+        else:
+            out.append(f"   {GREEN}✓{NC} hooks.json is valid")
+
+    skills_dir = plugin_dir / 'skills'
+    if skills_dir.is_dir():
+        for skill_dir in sorted(skills_dir.iterdir()):
+            if skill_dir.is_dir() and (skill_dir / 'SKILL.md').is_file():
+                skill_errors = cached_validate(cache, skill_dir / 'SKILL.md', str(skill_dir),
+                                               validators['skill'].validate_skill)
+                if has_critical_errors(skill_errors):
+                    out.append(f"   {YELLOW}⚠{NC}  Skill: {skill_dir.name} (validation warnings)")
+                    warnings += 1
+                else:
+                    out.append(f"   {GREEN}✓{NC} Skill: {skill_dir.name}")
+
+    commands_dir = plugin_dir / 'commands'
+    if commands_dir.is_dir():
+        for command in sorted(commands_dir.glob('*.md')):
+            command_errors = cached_validate(cache, command, str(command),
+                                             validators['command'].validate_command)
+            if has_critical_errors(command_errors):
+                out.append(f"   {RED}✗{NC} Command: {command.name} (validation failed)")
+                errors += 1
+            else:
+                out.append(f"   {GREEN}✓{NC} Command: {command.name}")
+
+    out.append("")
+    return errors, warnings
+
+
+class _RecordingCache(dict):
+    """Cache view that records writes so a parent process can merge them."""
+
+    def __init__(self, base):
+        super().__init__(base)
+        self.updates = {}
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.updates[key] = value
+
+
+# Shared by forked workers: validators are imported once in the parent,
+# so children inherit the loaded modules instead of re-importing PyYAML
+_VALIDATORS = None
+_CACHE = None
+
+
+def _validate_plugin_task(plugin_dir_str: str) -> tuple:
+    """Validate one plugin in a worker; picklable in and out.
+
+    Returns:
+        tuple: (error_count, warning_count, report_lines, cache_updates)
+    """
+    out = []
+    cache = _RecordingCache(_CACHE) if _CACHE is not None else None
+    errors, warnings = validate_plugin_components(Path(plugin_dir_str), _VALIDATORS, out, cache)
+    return errors, warnings, out, cache.updates if cache is not None else {}
+
+
+def main():
+    global _VALIDATORS, _CACHE
+
+    parser = argparse.ArgumentParser(description='Validate all plugin components in one process')
+    parser.add_argument('--summary-file',
+                        help='Write "<errors> <warnings>" totals to this file')
+    args = parser.parse_args()
+
+    _VALIDATORS = {
+        'agent': load_validator('validate_agent',
+                                SKILLS_DIR / 'building-agents' / 'scripts' / 'validate-agent.py'),
+        'skill': load_validator('validate_skill',
+                                SKILLS_DIR / 'building-skills' / 'scripts' / 'validate-skill.py'),
+        'command': load_validator('validate_command',
+                                  SKILLS_DIR / 'building-commands' / 'scripts' / 'validate-command.py'),
+        'hooks': load_validator('validate_hooks',
+                                SKILLS_DIR / 'building-hooks' / 'scripts' / 'validate-hooks.py'),
+    }
+
+    _CACHE = cache = load_cache()
+    total_errors = 0
+    total_warnings = 0
+    out = []
+
+    plugin_dirs = sorted(p for p in REPO_ROOT.iterdir()
+                         if (p / '.claude-plugin').is_dir())
+
+    # Fan plugins out across a process pool; fork lets workers inherit the
+    # already-imported validators. Where fork is unavailable (Windows),
+    # fall back to the serial loop rather than re-importing per worker.
+    try:
+        ctx = multiprocessing.get_context('fork')
+    except ValueError:
+        ctx = None
+
+    if ctx is not None and len(plugin_dirs) > 1:
+        max_workers = min(len(plugin_dirs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx) as executor:
+            # map preserves submission order, keeping the report deterministic
+            for errors, warnings, lines, updates in executor.map(
+                    _validate_plugin_task, (str(p) for p in plugin_dirs)):
+                total_errors += errors
+                total_warnings += warnings
+                out.extend(lines)
+                if cache is not None:
+                    cache.update(updates)
+    else:
+        for plugin_dir in plugin_dirs:
+            plugin_errors, plugin_warnings = validate_plugin_components(plugin_dir, _VALIDATORS, out, cache)
+            total_errors += plugin_errors
+            total_warnings += plugin_warnings
+
+    save_cache(cache)
+
+    sys.stdout.write('\n'.join(out) + '\n')
+
+    if args.summary_file:
+        Path(args.summary_file).write_text(f"{total_errors} {total_warnings}\n")
+
+    return 1 if total_errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
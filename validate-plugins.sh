@@ -17,106 +17,15 @@ NC='\033[0m' # No Color
 ERRORS=0
 WARNINGS=0
 
-# Function to validate a plugin
-validate_plugin() {
-    local plugin_dir="$1"
-    local plugin_name=$(basename "$plugin_dir")
-
-    echo "📦 Validating plugin: $plugin_name"
-    echo "   Location: $plugin_dir"
-
-    # Check if plugin.json exists
-    if [ ! -f "$plugin_dir/.claude-plugin/plugin.json" ]; then
-        echo -e "   ${RED}✗${NC} Missing plugin.json manifest"
-        ERRORS=$((ERRORS + 1))
-        return
-    fi
-
-    # Validate plugin.json syntax
-    if ! python3 -m json.tool "$plugin_dir/.claude-plugin/plugin.json" >/dev/null 2>&1; then
-        echo -e "   ${RED}✗${NC} Invalid JSON in plugin.json"
-        ERRORS=$((ERRORS + 1))
-        return
-    fi
-
-    echo -e "   ${GREEN}✓${NC} plugin.json exists and is valid JSON"
-
-    # Validate agents
-    echo "   [DEBUG] Checking for agents directory: $plugin_dir/agents"
-    if [ -d "$plugin_dir/agents" ]; then
-        echo "   [DEBUG] Agents directory exists, looking for *.md files"
-        for agent in "$plugin_dir/agents"/*.md; do
-            echo "   [DEBUG] Processing: $agent"
-            if [ -f "$agent" ]; then
-                agent_name=$(basename "$agent")
-                # Run validation and capture output
-                # Temporarily disable exit-on-error to capture validation output
-                set +e
-                validation_output=$(python3 claude-component-builder/skills/building-agents/scripts/validate-agent.py "$agent" 2>&1)
-                validation_exit_code=$?
-                set -e
-
-                if [ $validation_exit_code -eq 0 ]; then
-                    echo -e "   ${GREEN}✓${NC} Agent: $agent_name"
-                else
-                    echo -e "   ${RED}✗${NC} Agent: $agent_name (validation failed with exit code $validation_exit_code)"
-                    echo "      Validation output: $validation_output"
-                    ERRORS=$((ERRORS + 1))
-                fi
-            fi
-        done
-    fi
-
-    # Validate hooks
-    if [ -f "$plugin_dir/hooks/hooks.json" ]; then
-        if python3 claude-component-builder/skills/building-hooks/scripts/validate-hooks.py "$plugin_dir/hooks/hooks.json" >/dev/null 2>&1; then
-            echo -e "   ${GREEN}✓${NC} hooks.json is valid"
-        else
-            echo -e "   ${RED}✗${NC} hooks.json validation failed"
-            ERRORS=$((ERRORS + 1))
-        fi
-    fi
-
-    # Validate skills
-    if [ -d "$plugin_dir/skills" ]; then
-        for skill_dir in "$plugin_dir/skills"/*; do
-            if [ -d "$skill_dir" ] && [ -f "$skill_dir/SKILL.md" ]; then
-                skill_name=$(basename "$skill_dir")
-                if python3 claude-component-builder/skills/building-skills/scripts/validate-skill.py "$skill_dir" >/dev/null 2>&1; then
-                    echo -e "   ${GREEN}✓${NC} Skill: $skill_name"
-                else
-                    echo -e "   ${YELLOW}⚠${NC}  Skill: $skill_name (validation warnings)"
-                    WARNINGS=$((WARNINGS + 1))
-                fi
-            fi
-        done
-    fi
-
-    # Validate commands
-    if [ -d "$plugin_dir/commands" ]; then
-        for command in "$plugin_dir/commands"/*.md; do
-            if [ -f "$command" ]; then
-                command_name=$(basename "$command")
-                if python3 claude-component-builder/skills/building-commands/scripts/validate-command.py "$command" >/dev/null 2>&1; then
-                    echo -e "   ${GREEN}✓${NC} Command: $command_name"
-                else
-                    echo -e "   ${RED}✗${NC} Command: $command_name (validation failed)"
-                    ERRORS=$((ERRORS + 1))
-                fi
-            fi
-        done
-    fi
-
-    echo ""
-}
-
-# Find all plugin directories
-for plugin_dir in */; do
-    # Skip directories that don't look like plugins
-    if [ -d "$plugin_dir/.claude-plugin" ]; then
-        validate_plugin "$plugin_dir"
-    fi
-done
+# Validate all plugin components with a single python3 invocation
+# (validate-components.py imports each validator once and runs in-process,
+# instead of spawning a fresh interpreter per component)
+summary_file=$(mktemp)
+python3 "$SCRIPT_DIR/validate-components.py" --summary-file "$summary_file"
+read -r component_errors component_warnings < "$summary_file"
+rm -f "$summary_file"
+ERRORS=$((ERRORS + component_errors))
+WARNINGS=$((WARNINGS + component_warnings))
 
 # Validate marketplace.json
 echo "📋 Validating marketplace.json..."